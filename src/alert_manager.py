@@ -8,17 +8,28 @@ Author: AI-102 Study Implementation
 """
 
 import json
+import sys
+import threading
+from collections import Counter, deque
+from itertools import islice
 from datetime import datetime
-from typing import List, Dict
-from dataclasses import dataclass, asdict
+from typing import BinaryIO, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Faster JSON encoder for reports (optional)
 try:
-    from .config import AlertConfig
-    from .validators import validate_severity_level, validate_confidence_score
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    from config import AlertConfig
-    from validators import validate_severity_level, validate_confidence_score
+    ORJSON_AVAILABLE = False
+
+try:
+    from .config import AlertConfig, DATACLASS_SLOTS
+    from .validators import validate_alert_fields
+except ImportError:
+    from config import AlertConfig, DATACLASS_SLOTS
+    from validators import validate_alert_fields
 
 
 class ThreatLevel(Enum):
@@ -29,7 +40,8 @@ class ThreatLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+# Slotted instances (Python 3.10+) drop the per-alert __dict__
+@dataclass(**DATACLASS_SLOTS)
 class TheftAlert:
     """Represents a detected suspicious activity."""
     
@@ -41,22 +53,46 @@ class TheftAlert:
     image_path: str
     bounding_boxes: List[Dict]
     severity: str = "MEDIUM"
+    _timestamp_iso: Optional[Tuple[datetime, str]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
     
     def __post_init__(self):
         """Validate alert data after initialization."""
-        validate_severity_level(self.severity)
-        validate_confidence_score(self.confidence)
+        validate_alert_fields(self.severity, self.confidence)
     
     def to_dict(self) -> Dict:
         """
         Convert alert to dictionary format.
         
+        Built as a literal rather than with dataclasses.asdict, which deep
+        copies every field. The box dicts are shared with the alert, so
+        callers must not mutate them.
+        
         Returns:
             Dictionary representation of the alert
         """
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            'timestamp': self.timestamp_iso,
+            'alert_type': self.alert_type,
+            'confidence': self.confidence,
+            'location': self.location,
+            'description': self.description,
+            'image_path': self.image_path,
+            'bounding_boxes': list(self.bounding_boxes),
+            'severity': self.severity
+        }
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 timestamp, formatted once and reused by every report."""
+        # Cached against the datetime it was built from, so reassigning
+        # timestamp invalidates it
+        cached = self._timestamp_iso
+        if cached is None or cached[0] is not self.timestamp:
+            cached = (self.timestamp, self.timestamp.isoformat())
+            self._timestamp_iso = cached
+        return cached[1]
 
 
 class AlertManager:
@@ -70,9 +106,25 @@ class AlertManager:
     - Prevent duplicate alerts
     """
     
-    def __init__(self):
-        """Initialize the alert manager."""
-        self._recent_alerts: List[TheftAlert] = []
+    def __init__(self, quiet: bool = False):
+        """
+        Initialize the alert manager.
+        
+        Args:
+            quiet: Skip the per-alert console banner (e.g. for benchmarks)
+        """
+        self._quiet = quiet
+        
+        # Bounded deque evicts the oldest alert in O(1) on each append
+        self._recent_alerts: deque = deque(maxlen=AlertConfig.MAX_RECENT_ALERTS)
+        
+        # Running tallies over the stored alerts, kept in step with the deque
+        self._type_counts: Counter = Counter()
+        self._severity_counts: Counter = Counter()
+        self._lock = threading.Lock()
+        
+        # Optional JSON Lines file receiving every alert as it is created
+        self._jsonl_sink: Optional[BinaryIO] = None
         print("✓ Alert Manager initialized")
     
     def create_alert(self,
@@ -110,7 +162,8 @@ class AlertManager:
         )
         
         self._add_alert(alert)
-        self._log_alert_to_console(alert)
+        if not self._quiet:
+            self._log_alert_to_console(alert)
         
         return alert
     
@@ -124,9 +177,11 @@ class AlertManager:
         Returns:
             List of TheftAlert objects
         """
-        if count is None:
-            return self._recent_alerts.copy()
-        return self._recent_alerts[-count:]
+        with self._lock:
+            if count is None:
+                return list(self._recent_alerts)
+            start = max(0, len(self._recent_alerts) - count)
+            return list(islice(self._recent_alerts, start, None))
     
     def get_alert_count(self) -> int:
         """
@@ -135,26 +190,62 @@ class AlertManager:
         Returns:
             Number of alerts
         """
-        return len(self._recent_alerts)
+        with self._lock:
+            return len(self._recent_alerts)
     
     def clear_alerts(self) -> None:
         """Clear all stored alerts."""
-        self._recent_alerts.clear()
+        with self._lock:
+            self._recent_alerts.clear()
+            self._type_counts.clear()
+            self._severity_counts.clear()
+    
+    def enable_jsonl_sink(self, path: str) -> None:
+        """
+        Append every new alert to a JSON Lines file as it is created.
+        
+        Unlike generate_report, the file keeps alerts that have since been
+        evicted from memory, and each alert is written exactly once.
+        
+        Args:
+            path: Path to the .jsonl file (appended to if it exists)
+        """
+        sink = open(path, 'ab')
+        with self._lock:
+            previous, self._jsonl_sink = self._jsonl_sink, sink
+        if previous is not None:
+            previous.close()
+    
+    def close_jsonl_sink(self) -> None:
+        """Stop writing alerts to the JSON Lines file and close it."""
+        with self._lock:
+            sink, self._jsonl_sink = self._jsonl_sink, None
+        if sink is not None:
+            sink.close()
     
-    def generate_report(self, output_file: str = "theft_report.json") -> Dict:
+    def generate_report(self, output_file: str = "theft_report.json", pretty: bool = True) -> Dict:
         """
         Generate a comprehensive JSON report of all alerts.
         
         Args:
             output_file: Path to output JSON file
+            pretty: Indent the file for reading; False writes compact JSON
             
         Returns:
             Report dictionary
         """
         report = self._build_report()
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=option))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(report, f, indent=2)
+                else:
+                    json.dump(report, f, separators=(',', ':'))
         
         print(f"\n✓ Report saved: {output_file}")
         
@@ -167,66 +258,94 @@ class AlertManager:
         Args:
             alert: TheftAlert to store
         """
-        self._recent_alerts.append(alert)
+        with self._lock:
+            # The deque is about to evict its oldest alert; drop it from the tallies
+            if len(self._recent_alerts) == self._recent_alerts.maxlen:
+                evicted = self._recent_alerts[0]
+                self._decrement(self._type_counts, evicted.alert_type)
+                self._decrement(self._severity_counts, evicted.severity)
+            
+            self._recent_alerts.append(alert)
+            self._type_counts[alert.alert_type] += 1
+            self._severity_counts[alert.severity] += 1
+            
+            if self._jsonl_sink is not None:
+                self._write_jsonl_line(alert)
+    
+    def _write_jsonl_line(self, alert: TheftAlert) -> None:
+        """
+        Write one alert to the JSON Lines sink (caller holds the lock).
         
-        # Keep only recent alerts to limit memory usage
-        if len(self._recent_alerts) > AlertConfig.MAX_RECENT_ALERTS:
-            self._recent_alerts = self._recent_alerts[-AlertConfig.MAX_RECENT_ALERTS:]
+        Each line is flushed so alerts survive a crash mid-video.
+        
+        Args:
+            alert: TheftAlert to write
+        """
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(alert.to_dict())
+        else:
+            line = json.dumps(alert.to_dict(), separators=(',', ':')).encode('utf-8')
+        
+        self._jsonl_sink.write(line + b'\n')
+        self._jsonl_sink.flush()
+    
+    @staticmethod
+    def _decrement(counts: Counter, key: str) -> None:
+        """
+        Decrement a tally, removing the key once it reaches zero.
+        
+        Args:
+            counts: Counter to update
+            key: Key to decrement
+        """
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
     
     def _log_alert_to_console(self, alert: TheftAlert) -> None:
         """
         Log alert details to console.
         
+        The banner is formatted up front and written with a single
+        stdout write instead of one print per line.
+        
         Args:
             alert: TheftAlert to log
         """
-        print(f"\n{'='*70}")
-        print(f"🚨 {alert.severity} ALERT")
-        print(f"{'='*70}")
-        print(f"Type: {alert.alert_type}")
-        print(f"Time: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Location: {alert.location}")
-        print(f"Confidence: {alert.confidence:.1%}")
-        print(f"Description: {alert.description}")
-        print(f"{'='*70}\n")
+        rule = '=' * 70
+        sys.stdout.write(
+            f"\n{rule}\n"
+            f"🚨 {alert.severity} ALERT\n"
+            f"{rule}\n"
+            f"Type: {alert.alert_type}\n"
+            f"Time: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Location: {alert.location}\n"
+            f"Confidence: {alert.confidence:.1%}\n"
+            f"Description: {alert.description}\n"
+            f"{rule}\n\n"
+        )
     
     def _build_report(self) -> Dict:
         """
         Build comprehensive alert report.
         
+        The alerts and tallies are copied under a single lock acquisition,
+        so the counts always agree with the alerts listed.
+        
         Returns:
             Report dictionary
         """
+        with self._lock:
+            alerts = list(self._recent_alerts)
+            by_type = dict(self._type_counts)
+            by_severity = dict(self._severity_counts)
+        
         report = {
             'generated': datetime.now().isoformat(),
-            'total_alerts': len(self._recent_alerts),
-            'by_type': self._count_alerts_by_type(),
-            'by_severity': self._count_alerts_by_severity(),
-            'alerts': [alert.to_dict() for alert in self._recent_alerts]
+            'total_alerts': len(alerts),
+            'by_type': by_type,
+            'by_severity': by_severity,
+            'alerts': [alert.to_dict() for alert in alerts]
         }
         
         return report
-    
-    def _count_alerts_by_type(self) -> Dict[str, int]:
-        """
-        Count alerts grouped by type.
-        
-        Returns:
-            Dictionary of alert_type -> count
-        """
-        counts = {}
-        for alert in self._recent_alerts:
-            counts[alert.alert_type] = counts.get(alert.alert_type, 0) + 1
-        return counts
-    
-    def _count_alerts_by_severity(self) -> Dict[str, int]:
-        """
-        Count alerts grouped by severity.
-        
-        Returns:
-            Dictionary of severity -> count
-        """
-        counts = {}
-        for alert in self._recent_alerts:
-            counts[alert.severity] = counts.get(alert.severity, 0) + 1
-        return counts
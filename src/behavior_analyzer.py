@@ -7,7 +7,8 @@ Analyzes behavior patterns for suspicious activity detection following SRP.
 Author: AI-102 Study Implementation
 """
 
-from typing import List, Dict, Optional
+import re
+from typing import Iterable, List, Dict, NamedTuple, Optional, Tuple
 
 try:
     from .config import (
@@ -31,6 +32,18 @@ except ImportError:
     from person_tracker import PersonTracker, PersonTrackingData
 
 
+class MovementResult(NamedTuple):
+    """Movement analysis of a tracked person."""
+    
+    is_rapid: bool
+    speed: float  # pixels per second
+    frames_tracked: int
+
+
+# Shared result for people without enough history to measure
+_NO_MOVEMENT = MovementResult(is_rapid=False, speed=0.0, frames_tracked=0)
+
+
 class BehaviorAnalyzer:
     """
     Analyzes behavior patterns to detect suspicious activities.
@@ -44,6 +57,28 @@ class BehaviorAnalyzer:
     
     def __init__(self):
         """Initialize the behavior analyzer."""
+        # One compiled alternation per category scans a name in a single pass
+        self._high_value_pattern = self._compile_item_pattern(ItemCategories.HIGH_VALUE_ITEMS)
+        self._concealment_pattern = self._compile_item_pattern(ItemCategories.CONCEALMENT_ITEMS)
+        
+        # Detector vocabulary is small and repeats every frame, so memoize per name
+        self._item_flags: Dict[str, Tuple[bool, bool]] = {}
+        
+        # One bit per distinct pattern tag; each pattern becomes a bitmask.
+        # Whole tags are matched, so 'car' never matches inside 'scarf'
+        pattern_tags = sorted({
+            tag.lower()
+            for tags, _ in BehaviorPatterns.SUSPICIOUS_PATTERNS
+            for tag in tags
+        })
+        self._tag_bits: Dict[str, int] = {tag: 1 << i for i, tag in enumerate(pattern_tags)}
+        self._pattern_masks: List[Tuple[int, str]] = []
+        for tags, description in BehaviorPatterns.SUSPICIOUS_PATTERNS:
+            mask = 0
+            for tag in tags:
+                mask |= self._tag_bits[tag.lower()]
+            self._pattern_masks.append((mask, description))
+        
         print("✓ Behavior Analyzer initialized")
     
     def analyze_object_for_high_value(self, object_name: str, zone_name: str) -> bool:
@@ -57,14 +92,24 @@ class BehaviorAnalyzer:
         Returns:
             True if high-value object is in suspicious location
         """
-        is_high_value = any(
-            item in object_name.lower() 
-            for item in ItemCategories.HIGH_VALUE_ITEMS
-        )
+        return self.is_high_value_at_exit(object_name, 'exit' in zone_name.lower())
+    
+    def is_high_value_at_exit(self, object_name: str, zone_is_exit: bool) -> bool:
+        """
+        Check if object is high-value and in a zone already known to be an exit.
         
-        is_near_exit = 'exit' in zone_name.lower()
+        Args:
+            object_name: Name of detected object
+            zone_is_exit: Precomputed exit flag of the object's zone
+            
+        Returns:
+            True if high-value object is at an exit
+        """
+        if not zone_is_exit:
+            return False
         
-        return is_high_value and is_near_exit
+        is_high_value, _ = self._classify_object(object_name)
+        return is_high_value
     
     def is_concealment_item(self, object_name: str) -> bool:
         """
@@ -76,32 +121,36 @@ class BehaviorAnalyzer:
         Returns:
             True if object is a concealment item
         """
-        return any(
-            item in object_name.lower() 
-            for item in ItemCategories.CONCEALMENT_ITEMS
-        )
+        _, is_concealment = self._classify_object(object_name)
+        return is_concealment
     
-    def detect_concealment_patterns(self, tags: List[str]) -> Optional[str]:
+    def detect_concealment_patterns(self, tags: Iterable[str]) -> Optional[str]:
         """
         Detect suspicious tag combinations that suggest concealment.
         
+        A pattern matches only when every one of its tags is present as a
+        whole tag (case-insensitive).
+        
         Args:
-            tags: List of scene tags from Azure AI Vision
+            tags: Scene tags from Azure AI Vision
             
         Returns:
             Description of pattern if detected, None otherwise
         """
-        normalized_tags = ' '.join(tag.lower() for tag in tags)
+        tag_bits = self._tag_bits
+        present = 0
+        for tag in tags:
+            present |= tag_bits.get(tag.lower(), 0)
         
-        for pattern_tags, description in BehaviorPatterns.SUSPICIOUS_PATTERNS:
-            if all(tag in normalized_tags for tag in pattern_tags):
+        for mask, description in self._pattern_masks:
+            if present & mask == mask:
                 return description
         
         return None
     
     def analyze_person_movement(self, 
                                 tracking_data: PersonTrackingData,
-                                current_frame: int) -> Dict[str, any]:
+                                current_frame: int) -> MovementResult:
         """
         Analyze movement patterns of a tracked person.
         
@@ -110,23 +159,15 @@ class BehaviorAnalyzer:
             current_frame: Current frame number
             
         Returns:
-            Dictionary with movement analysis:
-                - is_rapid: bool
-                - speed: float (pixels per second)
-                - frames_tracked: int
-        """
-        result = {
-            'is_rapid': False,
-            'speed': 0.0,
-            'frames_tracked': 0
-        }
-        
-        positions = tracking_data.get_recent_positions(
+            MovementResult with is_rapid, speed (pixels per second) and
+            frames_tracked
+        """
+        positions = tracking_data.get_recent_boxes(
             TrackingConfig.POSITION_HISTORY_SIZE
         )
         
         if len(positions) < 2:
-            return result
+            return _NO_MOVEMENT
         
         # Calculate timespan in seconds
         frames_used = len(positions)
@@ -135,11 +176,11 @@ class BehaviorAnalyzer:
         # Calculate speed
         speed = calculate_movement_speed(positions, time_span)
         
-        result['speed'] = speed
-        result['frames_tracked'] = len(tracking_data.position_history)
-        result['is_rapid'] = speed > TrackingConfig.RAPID_MOVEMENT_THRESHOLD
-        
-        return result
+        return MovementResult(
+            is_rapid=speed > TrackingConfig.RAPID_MOVEMENT_THRESHOLD,
+            speed=speed,
+            frames_tracked=tracking_data.history_length
+        )
     
     def should_alert_for_loitering(self,
                                    tracking_data: PersonTrackingData,
@@ -170,3 +211,38 @@ class BehaviorAnalyzer:
             Adjusted confidence score
         """
         return base_confidence * AlertConfig.HIGH_VALUE_EXIT_CONFIDENCE_MULTIPLIER
+    
+    def _classify_object(self, object_name: str) -> Tuple[bool, bool]:
+        """
+        Classify an object name against the monitored item categories.
+        
+        Args:
+            object_name: Name of detected object
+            
+        Returns:
+            Tuple of (is_high_value, is_concealment_item)
+        """
+        flags = self._item_flags.get(object_name)
+        
+        if flags is None:
+            name = object_name.lower()
+            flags = (
+                self._high_value_pattern.search(name) is not None,
+                self._concealment_pattern.search(name) is not None
+            )
+            self._item_flags[object_name] = flags
+        
+        return flags
+    
+    @staticmethod
+    def _compile_item_pattern(items: List[str]) -> re.Pattern:
+        """
+        Compile item keywords into one substring-matching regex.
+        
+        Args:
+            items: Item keywords (matched anywhere in the lowercased name)
+            
+        Returns:
+            Compiled alternation pattern
+        """
+        return re.compile('|'.join(re.escape(item.lower()) for item in items))
@@ -8,10 +8,15 @@ following the Clean Code principle of avoiding magic numbers in code.
 Author: AI-102 Study Implementation
 """
 
+import sys
 from dataclasses import dataclass
 from typing import List, Tuple
 
 
+# Keyword arguments giving slotted dataclasses where supported (Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 # =============================================================================
 # DETECTION THRESHOLDS
 # =============================================================================
@@ -27,6 +32,9 @@ class DetectionThresholds:
     
     # Minimum confidence for object detection
     MIN_OBJECT_CONFIDENCE = 0.6
+    
+    # Fraction of a bounding box that must overlap a zone to place it there
+    MIN_ZONE_OVERLAP = 0.5
 
 
 # =============================================================================
@@ -56,6 +64,12 @@ class TrackingConfig:
     # Maximum distance in pixels for matching people across frames
     MAX_TRACKING_DISTANCE_PIXELS = 100
     
+    # Squared matching distance, compared against squared center offsets
+    MAX_TRACKING_DISTANCE_PIXELS_SQ = MAX_TRACKING_DISTANCE_PIXELS ** 2
+    
+    # Active tracks needed before matching switches to a KD-tree (requires scipy)
+    KD_TREE_MIN_TRACKS = 32
+    
     # Rapid movement threshold in pixels per second
     RAPID_MOVEMENT_THRESHOLD = 500
     
@@ -67,6 +81,57 @@ class TrackingConfig:
     
     # Frame skip interval for video processing (process every Nth frame)
     FRAME_SKIP_INTERVAL = 30  # ~1 frame per second at 30fps
+    
+    # Largest frame gap a track survives unmatched; positions are extrapolated
+    # across the gap so sampled video frames keep their tracks
+    MAX_TRACK_GAP_FRAMES = FRAME_SKIP_INTERVAL
+    
+    # Tracks not updated for this many frames are evicted after each analyzed
+    # frame; must stay larger than MAX_TRACK_GAP_FRAMES so gaps can be bridged
+    TRACK_MAX_AGE_FRAMES = 10 * FRAME_SKIP_INTERVAL
+
+
+# =============================================================================
+# VIDEO PIPELINE
+# =============================================================================
+
+class PipelineConfig:
+    """Configuration for the concurrent video processing pipeline."""
+    
+    # Maximum number of Azure AI Vision requests in flight at once
+    MAX_CONCURRENT_API_CALLS = 8
+    
+    # JPEG quality used when encoding frames in memory for analysis
+    FRAME_JPEG_QUALITY = 85
+    
+    # Frames whose longer edge exceeds this are downscaled before upload;
+    # detections are mapped back to full-resolution coordinates (0 = off)
+    MAX_ANALYSIS_EDGE_PX = 1280
+    
+    # Capacity of the queue between the frame reader and the analysis stage
+    FRAME_QUEUE_SIZE = 32
+    
+    # Capacity of the queue feeding the alert image writer
+    ALERT_QUEUE_SIZE = 32
+    
+    # Source prefixes treated as live streams (only the newest frame is kept)
+    LIVE_STREAM_PREFIXES = ('rtsp://', 'rtmp://', 'http://', 'https://')
+    
+    # Ask FFmpeg for hardware-accelerated decoding (falls back to CPU)
+    USE_HW_DECODE = True
+    
+    # Sampled frames whose 64-bit dHash differs from the last analyzed frame
+    # by fewer bits than this reuse its analysis instead of being sent (0 = off)
+    UNCHANGED_FRAME_HASH_DISTANCE = 5
+    
+    # Adapt the sampling interval to activity: halve it after a frame with
+    # alerts, stretch it by a quarter after a frame without any
+    ADAPTIVE_FRAME_SKIP = False
+    MIN_FRAME_SKIP_INTERVAL = 5
+    
+    # Upper bound when stretching; longer gaps than the tracker bridges
+    # would end tracks between samples
+    MAX_FRAME_SKIP_INTERVAL = TrackingConfig.MAX_TRACK_GAP_FRAMES
 
 
 # =============================================================================
@@ -131,9 +196,9 @@ class BehaviorPatterns:
 # ZONE DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ZoneDefinition:
-    """Template for creating detection zones."""
+    """Template for creating detection zones (immutable)."""
     
     name: str
     coordinates: List[Tuple[int, int]]
@@ -210,7 +275,6 @@ class FilePaths:
     DEFAULT_ALERT_DIR = "./alerts"
     DEFAULT_REPORT_FILE = "theft_report.json"
     DEMO_IMAGE_FILE = "demo_store.jpg"
-    TEMP_FRAME_FILE = "temp_frame.jpg"
 
 
 # =============================================================================
@@ -228,6 +292,17 @@ class AzureVisionConfig:
         'TAGS',     # Get scene understanding tags
         'CAPTION'   # Get natural language description
     ]
+    
+    # Kept-alive HTTPS connections shared by concurrent analysis requests
+    # (should be at least PipelineConfig.MAX_CONCURRENT_API_CALLS)
+    CONNECTION_POOL_SIZE = 32
+    
+    # Analysis results kept in memory, keyed by a hash of the image bytes
+    # (0 disables the cache)
+    RESULT_CACHE_SIZE = 1024
+    
+    # Directory persisting cached results across runs (None keeps them in memory only)
+    RESULT_CACHE_DIR = None
 
 
 # =============================================================================
@@ -7,7 +7,8 @@ Orchestrates the theft detection pipeline using Single Responsibility components
 Author: AI-102 Study Implementation
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 try:
@@ -17,7 +18,7 @@ try:
     from .alert_manager import AlertManager, TheftAlert
     from .behavior_analyzer import BehaviorAnalyzer
     from .geometry_utils import calculate_bounding_box_center
-    from .config import DetectionThresholds
+    from .config import DetectionThresholds, PipelineConfig
 except ImportError:
     from vision_analyzer import VisionAnalyzer
     from person_tracker import PersonTracker
@@ -25,7 +26,7 @@ except ImportError:
     from alert_manager import AlertManager, TheftAlert
     from behavior_analyzer import BehaviorAnalyzer
     from geometry_utils import calculate_bounding_box_center
-    from config import DetectionThresholds
+    from config import DetectionThresholds, PipelineConfig
 
 
 class DetectionOrchestrator:
@@ -39,7 +40,8 @@ class DetectionOrchestrator:
     def __init__(self,
                  vision_analyzer: VisionAnalyzer,
                  zone_monitor: ZoneMonitor,
-                 alert_manager: AlertManager):
+                 alert_manager: AlertManager,
+                 quiet: bool = False):
         """
         Initialize the detection orchestrator.
         
@@ -47,45 +49,128 @@ class DetectionOrchestrator:
             vision_analyzer: VisionAnalyzer instance
             zone_monitor: ZoneMonitor instance
             alert_manager: AlertManager instance
+            quiet: Skip per-frame progress output; errors are still printed
         """
         self._vision_analyzer = vision_analyzer
         self._zone_monitor = zone_monitor
         self._alert_manager = alert_manager
         self._person_tracker = PersonTracker()
         self._behavior_analyzer = BehaviorAnalyzer()
+        self._quiet = quiet
         
         print("✓ Detection Orchestrator initialized")
     
-    def analyze_frame(self, image_path: str, frame_number: int = 0) -> List[TheftAlert]:
+    def analyze_frame(self,
+                      image_path: str,
+                      frame_number: int = 0,
+                      image_bytes: Optional[bytes] = None) -> List[TheftAlert]:
         """
         Run complete analysis pipeline on a single frame.
         
         Args:
-            image_path: Path to image file
+            image_path: Path to image file (only a label if image_bytes is given)
             frame_number: Frame number for tracking (0 for single images)
+            image_bytes: Optional encoded image data to analyze instead of the file
             
         Returns:
             List of generated TheftAlert objects
         """
-        print(f"\n{'='*70}")
-        print(f"Analyzing: {image_path}")
-        print(f"{'='*70}")
+        self._print_frame_header(image_path)
         
         try:
             # Step 1: Get Azure AI Vision analysis
-            analysis_result = self._vision_analyzer.analyze_image(image_path)
+            if image_bytes is not None:
+                analysis_result = self._vision_analyzer.analyze_image_bytes(image_bytes)
+            else:
+                analysis_result = self._vision_analyzer.analyze_image(image_path)
+        except Exception as e:
+            print(f"✗ Error during analysis: {str(e)}")
+            return []
+        
+        return self.process_analysis_result(analysis_result, image_path, frame_number)
+    
+    def analyze_frames(self,
+                       image_paths: List[str],
+                       max_workers: int = PipelineConfig.MAX_CONCURRENT_API_CALLS) -> List[List[TheftAlert]]:
+        """
+        Run the analysis pipeline on a sequence of image files.
+        
+        Azure AI Vision calls are issued concurrently from a thread pool,
+        while detection runs on the calling thread in input order so
+        person tracking sees the frames in sequence.
+        
+        Args:
+            image_paths: Paths to image files; the list index is the frame number
+            max_workers: Maximum number of Azure AI Vision requests in flight
+            
+        Returns:
+            List of generated TheftAlert objects for each image, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._vision_analyzer.analyze_image, image_path)
+                for image_path in image_paths
+            ]
+            
+            results = []
+            for frame_number, (image_path, future) in enumerate(zip(image_paths, futures)):
+                self._print_frame_header(image_path)
+                
+                try:
+                    analysis_result = future.result()
+                except Exception as e:
+                    print(f"✗ Error during analysis: {str(e)}")
+                    results.append([])
+                    continue
+                
+                results.append(
+                    self.process_analysis_result(analysis_result, image_path, frame_number)
+                )
+        
+        return results
+    
+    def process_analysis_result(self,
+                                analysis_result,
+                                image_path: str,
+                                frame_number: int = 0,
+                                scale: float = 1.0) -> List[TheftAlert]:
+        """
+        Run the local detection stages on an Azure AI Vision result.
+        
+        Tracking state is updated here, so results from a video must be
+        passed in frame order even if they were fetched concurrently.
+        
+        Args:
+            analysis_result: Azure AI Vision analysis result
+            image_path: Image label recorded on generated alerts
+            frame_number: Frame number for tracking (0 for single images)
+            scale: Factor mapping result coordinates to zone coordinates,
+                for images that were downscaled before analysis
+            
+        Returns:
+            List of generated TheftAlert objects
+        """
+        try:
+            # Empty scenes (common between shoppers) skip the detection stages
+            if not self._has_detections(analysis_result):
+                self._person_tracker.cleanup_old_tracks(frame_number)
+                if not self._quiet:
+                    print(f"✓ Analysis complete: 0 alert(s)")
+                return []
             
             # Step 2: Analyze people
             people_alerts = self._analyze_people(
                 analysis_result, 
                 image_path, 
-                frame_number
+                frame_number,
+                scale
             )
             
             # Step 3: Analyze objects
             object_alerts = self._analyze_objects(
                 analysis_result, 
-                image_path
+                image_path,
+                scale
             )
             
             # Step 4: Analyze behavior patterns
@@ -97,7 +182,11 @@ class DetectionOrchestrator:
             
             all_alerts = people_alerts + object_alerts + behavior_alerts
             
-            print(f"✓ Analysis complete: {len(all_alerts)} alert(s)")
+            # Evict people who have not been seen for a while
+            self._person_tracker.cleanup_old_tracks(frame_number)
+            
+            if not self._quiet:
+                print(f"✓ Analysis complete: {len(all_alerts)} alert(s)")
             
             return all_alerts
             
@@ -105,10 +194,52 @@ class DetectionOrchestrator:
             print(f"✗ Error during analysis: {str(e)}")
             return []
     
+    def repeat_analysis_result(self,
+                               analysis_result,
+                               image_path: str,
+                               frame_number: int,
+                               scale: float = 1.0) -> List[TheftAlert]:
+        """
+        Re-apply an earlier Azure AI Vision result to an unchanged frame.
+        
+        The people in the result are tracked again at the new frame number,
+        so their tracks stay live and dwell time keeps growing. Only
+        loitering is re-checked; every other alert from the result was
+        already raised when it was first processed.
+        
+        Args:
+            analysis_result: Azure AI Vision analysis result being reused
+            image_path: Image label recorded on generated alerts
+            frame_number: Frame number of the unchanged frame
+            scale: Factor mapping result coordinates to zone coordinates
+            
+        Returns:
+            List of generated loitering alerts
+        """
+        try:
+            alerts = []
+            if self._has_detections(analysis_result):
+                alerts = self._analyze_people(
+                    analysis_result,
+                    image_path,
+                    frame_number,
+                    scale,
+                    loitering_only=True
+                )
+            
+            self._person_tracker.cleanup_old_tracks(frame_number)
+            return alerts
+            
+        except Exception as e:
+            print(f"✗ Error during analysis: {str(e)}")
+            return []
+    
     def _analyze_people(self, 
                        result, 
                        image_path: str, 
-                       frame_number: int) -> List[TheftAlert]:
+                       frame_number: int,
+                       scale: float = 1.0,
+                       loitering_only: bool = False) -> List[TheftAlert]:
         """
         Analyze detected people for suspicious activity.
         
@@ -116,6 +247,8 @@ class DetectionOrchestrator:
             result: Azure AI Vision analysis result
             image_path: Path to analyzed image
             frame_number: Current frame number
+            scale: Factor mapping result coordinates to zone coordinates
+            loitering_only: Skip the restricted area check (result reused)
             
         Returns:
             List of people-related alerts
@@ -125,29 +258,36 @@ class DetectionOrchestrator:
         if not result.people:
             return alerts
         
-        people_count = len(result.people.list)
-        print(f"\n→ Analyzing {people_count} person/people")
+        people = result.people.list
+        if not self._quiet:
+            print(f"\n→ Analyzing {len(people)} person/people")
+        
+        # Place each person in the zone covering most of their bounding box
+        bounding_boxes = [
+            self._create_bounding_box_dict(person.bounding_box, scale)
+            for person in people
+        ]
+        zones = self._zone_monitor.find_zones_by_overlap(bounding_boxes)
+        
+        # Track everyone across frames with one joint assignment
+        person_ids = self._person_tracker.track_people(bounding_boxes, frame_number)
         
-        for idx, person in enumerate(result.people.list):
-            bbox = person.bounding_box
-            bounding_box = self._create_bounding_box_dict(bbox)
+        for idx, (person, bounding_box, zone, person_id) in enumerate(
+                zip(people, bounding_boxes, zones, person_ids)):
             confidence = person.confidence
             
-            print(f"  Person {idx + 1}: ({bbox.x}, {bbox.y}) confidence={confidence:.2%}")
-            
-            # Track person across frames
-            person_id = self._person_tracker.track_person(bounding_box, frame_number)
-            
-            # Find which zone they're in
-            zone = self._zone_monitor.find_zone_for_bounding_box(bounding_box)
+            if not self._quiet:
+                print(f"  Person {idx + 1}: ({bounding_box['x']}, {bounding_box['y']}) "
+                      f"confidence={confidence:.2%}")
             
             if zone:
                 # Check for restricted area violation
-                alert = self._check_restricted_area_violation(
-                    zone, bounding_box, confidence, image_path
-                )
-                if alert:
-                    alerts.append(alert)
+                if not loitering_only:
+                    alert = self._check_restricted_area_violation(
+                        zone, bounding_box, confidence, image_path
+                    )
+                    if alert:
+                        alerts.append(alert)
                 
                 # Check for loitering
                 alert = self._check_loitering_violation(
@@ -158,13 +298,14 @@ class DetectionOrchestrator:
         
         return alerts
     
-    def _analyze_objects(self, result, image_path: str) -> List[TheftAlert]:
+    def _analyze_objects(self, result, image_path: str, scale: float = 1.0) -> List[TheftAlert]:
         """
         Analyze detected objects for suspicious activity.
         
         Args:
             result: Azure AI Vision result
             image_path: Image being analyzed
+            scale: Factor mapping result coordinates to zone coordinates
             
         Returns:
             List of object-related alerts
@@ -174,9 +315,10 @@ class DetectionOrchestrator:
         if not result.objects:
             return alerts
         
-        object_count = len(result.objects.list)
-        print(f"\n→ Analyzing {object_count} object(s)")
+        if not self._quiet:
+            print(f"\n→ Analyzing {len(result.objects.list)} object(s)")
         
+        detections = []
         for obj in result.objects.list:
             obj_name = obj.tags[0].name if obj.tags else "unknown"
             confidence = obj.tags[0].confidence if obj.tags else 0.0
@@ -185,13 +327,17 @@ class DetectionOrchestrator:
             if confidence < DetectionThresholds.MIN_CONFIDENCE:
                 continue
             
-            bbox = obj.bounding_box
-            bounding_box = self._create_bounding_box_dict(bbox)
-            
-            print(f"  Object: {obj_name} (confidence={confidence:.2%})")
-            
-            # Find zone
-            zone = self._zone_monitor.find_zone_for_bounding_box(bounding_box)
+            bounding_box = self._create_bounding_box_dict(obj.bounding_box, scale)
+            detections.append((obj_name, confidence, bounding_box))
+        
+        # Place each object in the zone covering most of its bounding box
+        zones = self._zone_monitor.find_zones_by_overlap(
+            [bounding_box for _, _, bounding_box in detections]
+        )
+        
+        for (obj_name, confidence, bounding_box), zone in zip(detections, zones):
+            if not self._quiet:
+                print(f"  Object: {obj_name} (confidence={confidence:.2%})")
             
             if zone:
                 # Check for high-value item at exit
@@ -202,7 +348,7 @@ class DetectionOrchestrator:
                     alerts.append(alert)
                 
                 # Log concealment items
-                if self._behavior_analyzer.is_concealment_item(obj_name):
+                if not self._quiet and self._behavior_analyzer.is_concealment_item(obj_name):
                     print(f"    ⓘ Concealment item: {obj_name}")
         
         return alerts
@@ -227,14 +373,15 @@ class DetectionOrchestrator:
         if not result.tags:
             return alerts
         
-        print(f"\n→ Checking concealment patterns")
+        if not self._quiet:
+            print(f"\n→ Checking concealment patterns")
         
         # Extract high-confidence tags
-        tags = [
-            tag.name 
+        tags = {
+            tag.name
             for tag in result.tags.list 
             if tag.confidence > DetectionThresholds.MIN_CONFIDENCE
-        ]
+        }
         
         # Check for concealment patterns
         pattern_description = self._behavior_analyzer.detect_concealment_patterns(tags)
@@ -250,7 +397,8 @@ class DetectionOrchestrator:
                 severity="MEDIUM"
             )
             alerts.append(alert)
-            print(f"  ⚠ MEDIUM: {pattern_description}")
+            if not self._quiet:
+                print(f"  ⚠ MEDIUM: {pattern_description}")
         
         return alerts
     
@@ -273,7 +421,8 @@ class DetectionOrchestrator:
             severity="CRITICAL"
         )
         
-        print(f"    ⚠ CRITICAL: Restricted area violation!")
+        if not self._quiet:
+            print(f"    ⚠ CRITICAL: Restricted area violation!")
         
         return alert
     
@@ -312,7 +461,8 @@ class DetectionOrchestrator:
             severity="MEDIUM"
         )
         
-        print(f"    ⚠ MEDIUM: Loitering detected ({dwell_time:.0f}s)")
+        if not self._quiet:
+            print(f"    ⚠ MEDIUM: Loitering detected ({dwell_time:.0f}s)")
         
         return alert
     
@@ -323,10 +473,7 @@ class DetectionOrchestrator:
                                  confidence: float,
                                  image_path: str) -> TheftAlert:
         """Check for high-value item at exit."""
-        if not self._behavior_analyzer.analyze_object_for_high_value(
-            object_name, 
-            zone.name
-        ):
+        if not self._behavior_analyzer.is_high_value_at_exit(object_name, zone.is_exit):
             return None
         
         adjusted_confidence = self._behavior_analyzer.calculate_confidence_for_high_value_exit(
@@ -343,20 +490,59 @@ class DetectionOrchestrator:
             severity="HIGH"
         )
         
-        print(f"    ⚠ HIGH: High-value item at exit!")
+        if not self._quiet:
+            print(f"    ⚠ HIGH: High-value item at exit!")
         
         return alert
     
-    def _create_bounding_box_dict(self, bbox) -> Dict:
+    @staticmethod
+    def _has_detections(result) -> bool:
+        """
+        Check whether an analysis result contains any people, objects or tags.
+        
+        Azure returns empty result blocks for requested features, so the
+        lists themselves are checked.
+        
+        Args:
+            result: Azure AI Vision analysis result
+            
+        Returns:
+            True if at least one block has entries
+        """
+        return any(
+            block and block.list
+            for block in (result.people, result.objects, result.tags)
+        )
+    
+    def _print_frame_header(self, image_path: str) -> None:
+        """
+        Print the banner that opens a frame's console output.
+        
+        Args:
+            image_path: Image label being analyzed
+        """
+        if not self._quiet:
+            print(f"\n{'='*70}\nAnalyzing: {image_path}\n{'='*70}")
+    
+    def _create_bounding_box_dict(self, bbox, scale: float = 1.0) -> Dict:
         """
         Create a standardized bounding box dictionary.
         
         Args:
             bbox: Azure bounding box object
+            scale: Factor applied to every coordinate (1.0 keeps them as-is)
             
         Returns:
             Dictionary with x, y, width, height
         """
+        if scale != 1.0:
+            return {
+                'x': round(bbox.x * scale),
+                'y': round(bbox.y * scale),
+                'width': round(bbox.width * scale),
+                'height': round(bbox.height * scale)
+            }
+        
         return {
             'x': bbox.x,
             'y': bbox.y,
@@ -364,6 +550,11 @@ class DetectionOrchestrator:
             'height': bbox.height
         }
     
+    @property
+    def vision_analyzer(self) -> VisionAnalyzer:
+        """Get the vision analyzer."""
+        return self._vision_analyzer
+    
     @property
     def person_tracker(self) -> PersonTracker:
         """Get the person tracker."""
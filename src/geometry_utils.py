@@ -11,6 +11,19 @@ import math
 from typing import Dict, List, Tuple
 import numpy as np
 
+# JIT compilation for the numeric kernels (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 def point_in_polygon(point: Tuple[int, int], 
                      polygon: List[Tuple[int, int]]) -> bool:
@@ -68,6 +81,212 @@ def _is_point_on_ray(x: float, y: float,
     return False
 
 
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ray casting: test many points against one polygon at once.
+    
+    Applies the same edge-crossing rule as point_in_polygon to every
+    (point, edge) pair with NumPy broadcasting, so results match the
+    scalar version exactly.
+    
+    Args:
+        points: Array of shape (M, 2) with (x, y) coordinates
+        polygon: Array of shape (N, 2) with polygon vertices
+        
+    Returns:
+        Boolean array of shape (M,), True where the point is inside
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    
+    if len(polygon) < 3:
+        return np.zeros(len(points), dtype=bool)
+    
+    if NUMBA_AVAILABLE:
+        return _points_in_polygon_kernel(points, polygon)
+    
+    # Edges (p1 -> p2) as rows, broadcast against points as columns
+    p1x, p1y = polygon[:, 0], polygon[:, 1]
+    p2x, p2y = np.roll(polygon[:, 0], -1), np.roll(polygon[:, 1], -1)
+    x = points[:, 0:1]
+    y = points[:, 1:2]
+    
+    spans_y = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y))
+    candidate = spans_y & (x <= np.maximum(p1x, p2x)) & (p1y != p2y)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+    
+    crosses = candidate & ((p1x == p2x) | (x <= xinters))
+    return (np.count_nonzero(crosses, axis=1) % 2) == 1
+
+
+@njit(cache=True)
+def _point_in_polygon_kernel(x: float, y: float, polygon: np.ndarray) -> bool:
+    """
+    Compiled ray cast of a single point against an (N, 2) polygon.
+    
+    Args:
+        x: X coordinate
+        y: Y coordinate
+        polygon: Float64 array of vertices
+        
+    Returns:
+        True if the point is inside
+    """
+    n = polygon.shape[0]
+    result = False
+    p1x = polygon[0, 0]
+    p1y = polygon[0, 1]
+    for i in range(1, n + 1):
+        p2x = polygon[i % n, 0]
+        p2y = polygon[i % n, 1]
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x) and p1y != p2y:
+            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            if p1x == p2x or x <= xinters:
+                result = not result
+        p1x = p2x
+        p1y = p2y
+    return result
+
+
+@njit(cache=True)
+def _points_in_polygon_kernel(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Compiled ray-cast loop over (M, 2) points and an (N, 2) polygon.
+    
+    Only used when numba is available; the interpreted fallback is the
+    broadcast version in points_in_polygon.
+    
+    Args:
+        points: Float64 array of (x, y) coordinates
+        polygon: Float64 array of vertices
+        
+    Returns:
+        Boolean array, True where the point is inside
+    """
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    
+    for k in range(points.shape[0]):
+        inside[k] = _point_in_polygon_kernel(points[k, 0], points[k, 1], polygon)
+    
+    return inside
+
+
+@njit(cache=True)
+def _path_length_kernel(centers: np.ndarray) -> float:
+    """
+    Compiled sum of Euclidean steps along a (K, 2) sequence of points.
+    
+    Args:
+        centers: Float64 array of (x, y) path points
+        
+    Returns:
+        Total path length
+    """
+    total = 0.0
+    for i in range(centers.shape[0] - 1):
+        dx = centers[i + 1, 0] - centers[i, 0]
+        dy = centers[i + 1, 1] - centers[i, 1]
+        total += math.sqrt(dx * dx + dy * dy)
+    return total
+
+
+@njit(cache=True)
+def _box_path_length_kernel(boxes: np.ndarray) -> float:
+    """
+    Compiled path length through the centers of a (K, 4) box array.
+    
+    Centers are derived inline, so no intermediate center array is built.
+    
+    Args:
+        boxes: Float64 array of x, y, width, height rows
+        
+    Returns:
+        Total path length
+    """
+    total = 0.0
+    for i in range(boxes.shape[0] - 1):
+        dx = (boxes[i + 1, 0] + boxes[i + 1, 2] * 0.5) - (boxes[i, 0] + boxes[i, 2] * 0.5)
+        dy = (boxes[i + 1, 1] + boxes[i + 1, 3] * 0.5) - (boxes[i, 1] + boxes[i, 3] * 0.5)
+        total += math.sqrt(dx * dx + dy * dy)
+    return total
+
+
+def polygon_box_overlap(polygon: np.ndarray, bbox: Dict) -> float:
+    """
+    Compute the fraction of a bounding box's area covered by a polygon.
+    
+    The polygon is clipped to the box (Sutherland-Hodgman against the four
+    box edges) and the clipped area is measured with the shoelace formula.
+    Concave polygons are handled because the clip window is convex.
+    
+    Args:
+        polygon: Array of shape (N, 2) with polygon vertices
+        bbox: Dictionary with x, y, width, height
+        
+    Returns:
+        Overlap ratio between 0.0 and 1.0 (0.0 for an empty box)
+    """
+    box_area = float(bbox['width']) * float(bbox['height'])
+    if box_area <= 0:
+        return 0.0
+    
+    clipped = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    x_min, y_min = float(bbox['x']), float(bbox['y'])
+    x_max, y_max = x_min + bbox['width'], y_min + bbox['height']
+    
+    for axis, bound, keep_above in ((0, x_min, True), (0, x_max, False),
+                                    (1, y_min, True), (1, y_max, False)):
+        clipped = _clip_polygon_to_half_plane(clipped, axis, bound, keep_above)
+        if len(clipped) < 3:
+            return 0.0
+    
+    x, y = clipped[:, 0], clipped[:, 1]
+    area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+    
+    return min(area / box_area, 1.0)
+
+
+def _clip_polygon_to_half_plane(vertices: np.ndarray,
+                                axis: int,
+                                bound: float,
+                                keep_above: bool) -> np.ndarray:
+    """
+    Clip a polygon to an axis-aligned half-plane (one Sutherland-Hodgman pass).
+    
+    Args:
+        vertices: Array of shape (N, 2) with polygon vertices
+        axis: 0 to clip on x, 1 to clip on y
+        bound: Coordinate of the clipping line
+        keep_above: Keep the side with coordinates >= bound if True, else <=
+        
+    Returns:
+        Array of clipped vertices in order
+    """
+    following = np.roll(vertices, -1, axis=0)
+    
+    if keep_above:
+        inside = vertices[:, axis] >= bound
+    else:
+        inside = vertices[:, axis] <= bound
+    next_inside = np.roll(inside, -1)
+    crosses = inside != next_inside
+    
+    # Where an edge crosses the line, interpolate the crossing point
+    delta = following - vertices
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(crosses, (bound - vertices[:, axis]) / delta[:, axis], 0.0)
+    crossing = vertices + t[:, None] * delta
+    crossing[:, axis] = bound
+    
+    # Each edge emits its start vertex if inside, then its crossing if any
+    candidates = np.stack([vertices, crossing], axis=1).reshape(-1, 2)
+    keep = np.column_stack([inside, crosses]).reshape(-1)
+    
+    return candidates[keep]
+
+
 def calculate_bounding_box_center(bbox: Dict) -> Tuple[float, float]:
     """
     Calculate the center point of a bounding box.
@@ -114,15 +333,16 @@ def calculate_euclidean_distance(point1: Tuple[float, float],
     """
     x1, y1 = point1
     x2, y2 = point2
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    return math.hypot(x2 - x1, y2 - y1)
 
 
-def calculate_path_distance(positions: List[Dict]) -> float:
+def calculate_path_distance(positions) -> float:
     """
     Calculate total distance traveled along a path of positions.
     
     Args:
-        positions: List of bounding box dictionaries representing path
+        positions: List of bounding box dictionaries representing path, or
+            an array of shape (K, 4) with x, y, width, height rows
         
     Returns:
         Total distance in pixels
@@ -130,6 +350,20 @@ def calculate_path_distance(positions: List[Dict]) -> float:
     if len(positions) < 2:
         return 0.0
     
+    if isinstance(positions, np.ndarray):
+        if NUMBA_AVAILABLE:
+            return float(_box_path_length_kernel(positions.astype(np.float64, copy=False)))
+        centers = positions[:, :2] + positions[:, 2:4] / 2
+        steps = np.diff(centers, axis=0)
+        return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+    
+    if NUMBA_AVAILABLE:
+        centers = np.array(
+            [calculate_bounding_box_center(position) for position in positions],
+            dtype=np.float64
+        )
+        return float(_path_length_kernel(centers))
+    
     total_distance = 0.0
     for i in range(len(positions) - 1):
         total_distance += calculate_distance_between_boxes(
@@ -140,13 +374,13 @@ def calculate_path_distance(positions: List[Dict]) -> float:
     return total_distance
 
 
-def calculate_movement_speed(positions: List[Dict], 
+def calculate_movement_speed(positions, 
                             time_span_seconds: float) -> float:
     """
     Calculate movement speed from a sequence of positions.
     
     Args:
-        positions: List of bounding box positions over time
+        positions: Bounding box positions over time (list of dicts or (K, 4) array)
         time_span_seconds: Time span covered by positions
         
     Returns:
@@ -157,3 +391,22 @@ def calculate_movement_speed(positions: List[Dict],
     
     distance = calculate_path_distance(positions)
     return distance / time_span_seconds
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile (or load from cache) the numba kernels before the first frame.
+    
+    Called at pipeline start-up rather than on import, so importing this
+    module stays cheap. Does nothing when numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    triangle = np.array([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    boxes = np.zeros((2, 4))
+    
+    _point_in_polygon_kernel(0.25, 0.25, triangle)
+    _points_in_polygon_kernel(triangle, triangle)
+    _path_length_kernel(triangle)
+    _box_path_length_kernel(boxes)
@@ -7,40 +7,146 @@ Handles tracking people across video frames following Single Responsibility Prin
 Author: AI-102 Study Implementation
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import InitVar, dataclass, field
+from types import MappingProxyType
+import numpy as np
+
+# Spatial index for matching against many tracks (optional)
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 try:
-    from .geometry_utils import calculate_distance_between_boxes, calculate_movement_speed
     from .config import TrackingConfig
 except ImportError:
-    from geometry_utils import calculate_distance_between_boxes, calculate_movement_speed
     from config import TrackingConfig
 
 
+def _empty_history() -> np.ndarray:
+    """Allocate a position ring buffer with one (x, y, width, height) row per slot."""
+    return np.empty((TrackingConfig.POSITION_HISTORY_SIZE, 4), dtype=np.float64)
+
+
+def _empty_frames() -> np.ndarray:
+    """Allocate the frame numbers matching each position ring buffer slot."""
+    return np.empty(TrackingConfig.POSITION_HISTORY_SIZE, dtype=np.int64)
+
+
 @dataclass
 class PersonTrackingData:
-    """Data structure for tracking a single person across frames."""
+    """
+    Data structure for tracking a single person across frames.
+    
+    Recent positions live in a preallocated (capacity, 4) array used as a
+    ring buffer, so recording a position allocates nothing and movement
+    calculations run directly on the array. An initial position_history
+    list may still be passed to seed the buffer.
+    """
     
     person_id: str
     first_frame: int
     last_frame: int
-    position_history: List[Dict] = field(default_factory=list)
+    position_history: InitVar[Optional[List[Dict]]] = None
+    _boxes: np.ndarray = field(default_factory=_empty_history, init=False, repr=False)
+    _frames: np.ndarray = field(default_factory=_empty_frames, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self, position_history: Optional[List[Dict]]):
+        """Seed the ring buffer from an initial position history, if given."""
+        if position_history:
+            # Their frame numbers are unknown; record them at last_frame
+            for position in position_history[-len(self._boxes):]:
+                self._store_position(position, self.last_frame)
     
     def add_position(self, position: Dict, frame_number: int) -> None:
         """
         Add a new position to tracking history.
         
+        Once the buffer is full the oldest position is overwritten.
+        
         Args:
             position: Bounding box dictionary
             frame_number: Current frame number
         """
-        self.position_history.append(position)
+        self._store_position(position, frame_number)
         self.last_frame = frame_number
+    
+    def _store_position(self, position: Dict, frame_number: int) -> None:
+        """
+        Write a position into the next ring buffer slot.
+        
+        Args:
+            position: Bounding box dictionary
+            frame_number: Frame the position was recorded at
+        """
+        slot = self._count % len(self._boxes)
+        row = self._boxes[slot]
+        row[0] = position['x']
+        row[1] = position['y']
+        row[2] = position['width']
+        row[3] = position['height']
+        self._frames[slot] = frame_number
+        self._count += 1
+    
+    @property
+    def history_length(self) -> int:
+        """Number of positions currently stored."""
+        return min(self._count, len(self._boxes))
+    
+    @property
+    def last_position(self) -> Optional[Dict]:
+        """Most recent bounding box, or None if no position was recorded."""
+        if self._count == 0:
+            return None
+        x, y, width, height = self._boxes[(self._count - 1) % len(self._boxes)].tolist()
+        return {'x': x, 'y': y, 'width': width, 'height': height}
+    
+    @property
+    def last_center(self) -> Optional[Tuple[float, float]]:
+        """Center of the most recent bounding box, or None if no position was recorded."""
+        if self._count == 0:
+            return None
+        x, y, width, height = self._boxes[(self._count - 1) % len(self._boxes)].tolist()
+        return (x + width / 2, y + height / 2)
+    
+    def predict_center(self, frame_number: int) -> Optional[Tuple[float, float]]:
+        """
+        Extrapolate the bounding box center to a later frame.
         
-        # Keep only recent positions to limit memory usage
-        if len(self.position_history) > TrackingConfig.POSITION_HISTORY_SIZE:
-            self.position_history = self.position_history[-TrackingConfig.POSITION_HISTORY_SIZE:]
+        The velocity between the last two recorded positions is carried
+        forward linearly, so a person can be matched again after frames
+        that were skipped rather than analyzed.
+        
+        Args:
+            frame_number: Frame to predict the center for
+            
+        Returns:
+            Predicted (x, y) center, or None if no position was recorded
+        """
+        if self._count < 2 or len(self._boxes) < 2:
+            return self.last_center
+        
+        capacity = len(self._boxes)
+        last = (self._count - 1) % capacity
+        previous = (self._count - 2) % capacity
+        frame_step = int(self._frames[last] - self._frames[previous])
+        if frame_step <= 0:
+            return self.last_center
+        
+        x1, y1, w1, h1 = self._boxes[previous].tolist()
+        x2, y2, w2, h2 = self._boxes[last].tolist()
+        scale = (frame_number - int(self._frames[last])) / frame_step
+        
+        center_x = x2 + w2 / 2
+        center_y = y2 + h2 / 2
+        return (
+            center_x + (center_x - x1 - w1 / 2) * scale,
+            center_y + (center_y - y1 - h1 / 2) * scale
+        )
     
     def calculate_dwell_time(self, current_frame: int, fps: int = TrackingConfig.DEFAULT_FPS) -> float:
         """
@@ -56,6 +162,25 @@ class PersonTrackingData:
         frames_present = current_frame - self.first_frame
         return frames_present / fps
     
+    def get_recent_boxes(self, count: int = None) -> np.ndarray:
+        """
+        Get the most recent positions as an array.
+        
+        Args:
+            count: Number of recent positions to return (None for all)
+            
+        Returns:
+            Array of shape (K, 4) with x, y, width, height rows, oldest first
+        """
+        capacity = len(self._boxes)
+        n = self.history_length if count is None else min(count, self.history_length)
+        start = (self._count - n) % capacity
+        
+        # Contiguous slice when the window doesn't wrap, else gather in order
+        if start + n <= capacity:
+            return self._boxes[start:start + n]
+        return np.concatenate((self._boxes[start:], self._boxes[:start + n - capacity]))
+    
     def get_recent_positions(self, count: int = None) -> List[Dict]:
         """
         Get the most recent positions.
@@ -66,9 +191,17 @@ class PersonTrackingData:
         Returns:
             List of recent position dictionaries
         """
-        if count is None:
-            return self.position_history.copy()
-        return self.position_history[-count:]
+        return [
+            {'x': x, 'y': y, 'width': width, 'height': height}
+            for x, y, width, height in self.get_recent_boxes(count).tolist()
+        ]
+
+
+# Defined after the dataclass so the position_history InitVar keeps its default
+PersonTrackingData.position_history = property(
+    lambda self: self.get_recent_positions(),
+    doc="Stored positions as bounding box dictionaries, oldest first."
+)
 
 
 class PersonTracker:
@@ -82,10 +215,19 @@ class PersonTracker:
     - FairMOT
     """
     
-    def __init__(self):
-        """Initialize the person tracker."""
-        self._tracked_people: Dict[str, PersonTrackingData] = {}
+    def __init__(self, max_frame_gap: int = TrackingConfig.MAX_TRACK_GAP_FRAMES):
+        """
+        Initialize the person tracker.
+        
+        Args:
+            max_frame_gap: Most frames a track may go unmatched and still be
+                continued (1 only matches tracks from the previous frame)
+        """
+        # Ordered least recently updated first, so stale tracks sit at the front
+        self._tracked_people: "OrderedDict[str, PersonTrackingData]" = OrderedDict()
+        self._tracked_people_view = MappingProxyType(self._tracked_people)
         self._next_person_id = 0
+        self._max_frame_gap = max_frame_gap
     
     def track_person(self, bounding_box: Dict, frame_number: int) -> str:
         """
@@ -98,14 +240,36 @@ class PersonTracker:
         Returns:
             Person ID string
         """
-        person_id = self._find_matching_track(bounding_box, frame_number)
+        return self.track_people([bounding_box], frame_number)[0]
+    
+    def track_people(self, bounding_boxes: List[Dict], frame_number: int) -> List[str]:
+        """
+        Track all people detected in one frame.
         
-        if person_id is None:
-            person_id = self._create_new_track(bounding_box, frame_number)
-        else:
-            self._update_track(person_id, bounding_box, frame_number)
+        Detections are matched one-to-one against recent tracks, whose
+        centers are extrapolated across any skipped frames: pairwise
+        center distances are computed as a single NumPy matrix and the
+        closest pairs within the tracking distance are assigned first.
+        Unmatched detections start new tracks.
         
-        return person_id
+        Args:
+            bounding_boxes: Bounding box dictionaries with x, y, width, height
+            frame_number: Current frame number
+            
+        Returns:
+            Person ID string for each bounding box, in input order
+        """
+        matches = self._match_tracks(bounding_boxes, frame_number)
+        
+        person_ids = []
+        for bounding_box, person_id in zip(bounding_boxes, matches):
+            if person_id is None:
+                person_id = self._create_new_track(bounding_box, frame_number)
+            else:
+                self._update_track(person_id, bounding_box, frame_number)
+            person_ids.append(person_id)
+        
+        return person_ids
     
     def get_tracking_data(self, person_id: str) -> Optional[PersonTrackingData]:
         """
@@ -119,60 +283,133 @@ class PersonTracker:
         """
         return self._tracked_people.get(person_id)
     
-    def get_all_tracked_people(self) -> Dict[str, PersonTrackingData]:
+    def get_all_tracked_people(self) -> Mapping[str, PersonTrackingData]:
         """
         Get all currently tracked people.
         
+        The result is a read-only live view rather than a copy, so it
+        reflects later tracking updates; copy it with dict() to keep a
+        snapshot.
+        
         Returns:
-            Dictionary of person_id -> PersonTrackingData
+            Read-only mapping of person_id -> PersonTrackingData
         """
-        return self._tracked_people.copy()
+        return self._tracked_people_view
     
-    def cleanup_old_tracks(self, current_frame: int, max_age_frames: int = 300) -> None:
+    def cleanup_old_tracks(self,
+                           current_frame: int,
+                           max_age_frames: int = TrackingConfig.TRACK_MAX_AGE_FRAMES) -> None:
         """
         Remove tracks that haven't been updated recently.
         
+        Tracks are kept in update order, so only the expired tracks at the
+        front are visited.
+        
         Args:
             current_frame: Current frame number
             max_age_frames: Maximum age in frames before removing track
         """
-        to_remove = [
-            person_id
-            for person_id, data in self._tracked_people.items()
-            if current_frame - data.last_frame > max_age_frames
-        ]
-        
-        for person_id in to_remove:
-            del self._tracked_people[person_id]
+        while self._tracked_people:
+            data = next(iter(self._tracked_people.values()))
+            if current_frame - data.last_frame <= max_age_frames:
+                break
+            self._tracked_people.popitem(last=False)
     
-    def _find_matching_track(self, bounding_box: Dict, frame_number: int) -> Optional[str]:
+    def _match_tracks(self, bounding_boxes: List[Dict], frame_number: int) -> List[Optional[str]]:
         """
-        Find existing track that matches this detection.
+        Greedily assign detections to recent tracks by predicted distance.
         
         Args:
-            bounding_box: Current bounding box
+            bounding_boxes: Current bounding boxes
             frame_number: Current frame number
             
         Returns:
-            Person ID if match found, None otherwise
+            Matched person ID (or None) for each bounding box
         """
-        for person_id, data in self._tracked_people.items():
-            # Only match with recent tracks (previous frame)
-            if data.last_frame != frame_number - 1:
-                continue
-            
-            # Get last known position
-            if not data.position_history:
+        matches: List[Optional[str]] = [None] * len(bounding_boxes)
+        
+        # Only match with tracks seen within the allowed gap, at their
+        # predicted position for this frame
+        candidates = [
+            (person_id, data.predict_center(frame_number))
+            for person_id, data in self._tracked_people.items()
+            if 0 < frame_number - data.last_frame <= self._max_frame_gap
+            and data.history_length > 0
+        ]
+        
+        if not bounding_boxes or not candidates:
+            return matches
+        
+        detections = np.array([
+            (bbox['x'] + bbox['width'] / 2, bbox['y'] + bbox['height'] / 2)
+            for bbox in bounding_boxes
+        ], dtype=np.float64)
+        tracks = np.array([center for _, center in candidates], dtype=np.float64)
+        
+        if SCIPY_AVAILABLE and len(candidates) >= TrackingConfig.KD_TREE_MIN_TRACKS:
+            rows, cols, squared = self._pairs_within_distance_kdtree(detections, tracks)
+        else:
+            rows, cols, squared = self._pairs_within_distance(detections, tracks)
+        order = np.lexsort((cols, rows, squared))
+        
+        used_tracks = set()
+        for det_index, track_index in zip(rows[order].tolist(), cols[order].tolist()):
+            if matches[det_index] is not None or track_index in used_tracks:
                 continue
+            matches[det_index] = candidates[track_index][0]
+            used_tracks.add(track_index)
+        
+        return matches
+    
+    @staticmethod
+    def _pairs_within_distance(detections: np.ndarray,
+                               tracks: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find detection/track pairs within tracking distance using a dense matrix.
+        
+        Args:
+            detections: Detection centers, shape (N, 2)
+            tracks: Track centers, shape (M, 2)
             
-            last_position = data.position_history[-1]
-            distance = calculate_distance_between_boxes(bounding_box, last_position)
+        Returns:
+            Detection indices, track indices and squared distances of each pair
+        """
+        # squared_distances[i, j]: detection i to track j; squaring the
+        # threshold instead of taking roots keeps the same order and cut-off
+        offsets = detections[:, None, :] - tracks[None, :, :]
+        squared_distances = np.einsum('ijk,ijk->ij', offsets, offsets)
+        
+        rows, cols = np.nonzero(
+            squared_distances < TrackingConfig.MAX_TRACKING_DISTANCE_PIXELS_SQ
+        )
+        return rows, cols, squared_distances[rows, cols]
+    
+    @staticmethod
+    def _pairs_within_distance_kdtree(detections: np.ndarray,
+                                      tracks: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find detection/track pairs within tracking distance using KD-trees.
+        
+        Only pairs inside the search radius are visited, so the cost grows
+        with the number of nearby pairs rather than with N * M.
+        
+        Args:
+            detections: Detection centers, shape (N, 2)
+            tracks: Track centers, shape (M, 2)
             
-            # If close enough, consider it the same person
-            if distance < TrackingConfig.MAX_TRACKING_DISTANCE_PIXELS:
-                return person_id
+        Returns:
+            Detection indices, track indices and squared distances of each pair
+        """
+        pairs = cKDTree(detections).sparse_distance_matrix(
+            cKDTree(tracks),
+            TrackingConfig.MAX_TRACKING_DISTANCE_PIXELS,
+            output_type='ndarray'
+        )
+        squared = pairs['v'] * pairs['v']
         
-        return None
+        # The tree includes pairs exactly at the radius; the dense path does not
+        keep = squared < TrackingConfig.MAX_TRACKING_DISTANCE_PIXELS_SQ
+        return pairs['i'][keep], pairs['j'][keep], squared[keep]
     
     def _create_new_track(self, bounding_box: Dict, frame_number: int) -> str:
         """
@@ -191,9 +428,9 @@ class PersonTracker:
         tracking_data = PersonTrackingData(
             person_id=person_id,
             first_frame=frame_number,
-            last_frame=frame_number,
-            position_history=[bounding_box]
+            last_frame=frame_number
         )
+        tracking_data.add_position(bounding_box, frame_number)
         
         self._tracked_people[person_id] = tracking_data
         
@@ -210,3 +447,4 @@ class PersonTracker:
         """
         if person_id in self._tracked_people:
             self._tracked_people[person_id].add_position(bounding_box, frame_number)
+            self._tracked_people.move_to_end(person_id)
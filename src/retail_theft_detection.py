@@ -23,9 +23,13 @@ Author: AI-102 Study Implementation
 """
 
 import os
+import queue
+import threading
 import cv2
 import numpy as np
-from typing import List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Support both package and direct imports
@@ -34,15 +38,17 @@ try:
     from .zone_monitor import ZoneMonitor, DetectionZone
     from .alert_manager import AlertManager, TheftAlert, ThreatLevel
     from .detection_orchestrator import DetectionOrchestrator
-    from .config import TrackingConfig, FilePaths
-    from .validators import validate_directory_exists
+    from .config import TrackingConfig, PipelineConfig, FilePaths
+    from .validators import validate_directory_exists, ValidationError
+    from .geometry_utils import warm_up_kernels
 except ImportError:
     from vision_analyzer import VisionAnalyzer
     from zone_monitor import ZoneMonitor, DetectionZone
     from alert_manager import AlertManager, TheftAlert, ThreatLevel
     from detection_orchestrator import DetectionOrchestrator
-    from config import TrackingConfig, FilePaths
-    from validators import validate_directory_exists
+    from config import TrackingConfig, PipelineConfig, FilePaths
+    from validators import validate_directory_exists, ValidationError
+    from geometry_utils import warm_up_kernels
 
 
 # =============================================================================
@@ -87,26 +93,51 @@ class RetailTheftDetector:
         print("[OK] System Initialized Successfully")
         print(f"{'='*70}\n")
     
-    def analyze_frame(self, image_path: str, frame_number: int = 0) -> List[TheftAlert]:
+    def analyze_frame(self,
+                      image_path: str,
+                      frame_number: int = 0,
+                      image_bytes: Optional[bytes] = None) -> List[TheftAlert]:
         """
         Analyze a single frame for suspicious activity.
         
         Args:
-            image_path: Path to image file
+            image_path: Path to image file (only a label if image_bytes is given)
             frame_number: Frame number for tracking (0 for single images)  
+            image_bytes: Optional encoded image data to analyze instead of the file
             
         Returns:
             List of TheftAlert objects
         """
-        return self._orchestrator.analyze_frame(image_path, frame_number)
+        return self._orchestrator.analyze_frame(image_path, frame_number, image_bytes)
     
-    def process_video(self, video_path: str, output_dir: str = FilePaths.DEFAULT_ALERT_DIR) -> None:
+    def analyze_frames(self,
+                       image_paths: List[str],
+                       max_workers: int = PipelineConfig.MAX_CONCURRENT_API_CALLS) -> List[List[TheftAlert]]:
+        """
+        Analyze a sequence of frames, fetching their Azure analyses concurrently.
+        
+        Args:
+            image_paths: Paths to image files; the list index is the frame number
+            max_workers: Maximum number of Azure AI Vision requests in flight
+            
+        Returns:
+            List of TheftAlert objects for each image, in input order
+        """
+        return self._orchestrator.analyze_frames(image_paths, max_workers)
+    
+    def process_video(self,
+                      video_path: str,
+                      output_dir: str = FilePaths.DEFAULT_ALERT_DIR,
+                      batch_size: int = PipelineConfig.MAX_CONCURRENT_API_CALLS,
+                      use_gpu_decode: bool = PipelineConfig.USE_HW_DECODE) -> None:
         """
         Process video stream for theft detection.
         
         Args:
             video_path: Path to video file or camera index (0 for webcam)
             output_dir: Directory to save alert images
+            batch_size: Number of sampled frames analyzed concurrently
+            use_gpu_decode: Request hardware-accelerated decoding when available
         """
         print(f"\n{'='*70}")
         print(f"VIDEO PROCESSING")
@@ -118,22 +149,26 @@ class RetailTheftDetector:
         
         video_processor = VideoProcessor(
             orchestrator=self._orchestrator,
-            output_dir=output_dir
+            output_dir=output_dir,
+            batch_size=batch_size
         )
         
-        video_processor.process(video_path)
+        video_processor.process(video_path, use_gpu_decode=use_gpu_decode)
     
-    def generate_report(self, output_file: str = FilePaths.DEFAULT_REPORT_FILE) -> dict:
+    def generate_report(self,
+                        output_file: str = FilePaths.DEFAULT_REPORT_FILE,
+                        pretty: bool = True) -> dict:
         """
         Generate JSON report of all alerts.
         
         Args:
             output_file: Path to output JSON file
+            pretty: Indent the file for reading; False writes compact JSON
             
         Returns:
             Report dictionary
         """
-        return self._alert_manager.generate_report(output_file)
+        return self._alert_manager.generate_report(output_file, pretty=pretty)
     
     @property
     def zones(self) -> List[DetectionZone]:
@@ -150,6 +185,56 @@ class RetailTheftDetector:
 # VIDEO PROCESSING (Extracted to separate class)
 # =============================================================================
 
+class LatestFrameSlot:
+    """
+    Single-slot frame buffer that keeps only the freshest frame.
+    
+    Used for live sources: when a new frame arrives while the previous
+    one is still waiting for the analysis stage, the stale frame is
+    discarded so latency stays bounded under API slowdowns. The waiting
+    consumer is notified as soon as a frame lands, so nothing polls and
+    capture is paced by the source frame rate alone. Exposes the put/get
+    subset of queue.Queue used by the video pipeline.
+    """
+    
+    def __init__(self):
+        """Initialize an empty slot."""
+        self._condition = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.dropped = 0
+    
+    def put(self, item, timeout: float = None) -> None:
+        """
+        Store a frame, replacing any frame not yet taken.
+        
+        Args:
+            item: (frame, frame_num, frame_hash) tuple, or None to mark end of input
+            timeout: Ignored; the slot never blocks (queue.Queue compatibility)
+        """
+        with self._condition:
+            if item is None:
+                self._closed = True
+            else:
+                if self._item is not None:
+                    self.dropped += 1
+                self._item = item
+            self._condition.notify()
+    
+    def get(self):
+        """
+        Take the pending frame, waiting until one is available.
+        
+        Returns:
+            (frame, frame_num, frame_hash) tuple, or None once input has ended
+        """
+        with self._condition:
+            while self._item is None and not self._closed:
+                self._condition.wait()
+            item, self._item = self._item, None
+            return item
+
+
 class VideoProcessor:
     """
     Processes video streams for theft detection.
@@ -157,25 +242,46 @@ class VideoProcessor:
     Separated from main detector class following Single Responsibility Principle.
     """
     
-    def __init__(self, orchestrator: DetectionOrchestrator, output_dir: str):
+    def __init__(self,
+                 orchestrator: DetectionOrchestrator,
+                 output_dir: str,
+                 batch_size: int = PipelineConfig.MAX_CONCURRENT_API_CALLS):
         """
         Initialize video processor.
         
         Args:
             orchestrator: DetectionOrchestrator instance
             output_dir: Directory to save alert images
+            batch_size: Number of sampled frames analyzed concurrently
+            
+        Raises:
+            ValidationError: If batch_size is less than 1
         """
+        if batch_size < 1:
+            raise ValidationError(f"Batch size must be at least 1, got {batch_size}")
+        
         self._orchestrator = orchestrator
         self._output_dir = output_dir
+        self._batch_size = batch_size
+        
+        # Rendered alert headlines as coverage masks, keyed by their text
+        self._banner_cache: Dict[str, np.ndarray] = {}
+        
+        # Reused annotation canvas; only the writer thread draws on it
+        self._scratch: Optional[np.ndarray] = None
+        
+        # Sampling interval read by the reader thread, tuned by the main thread
+        self._current_skip = TrackingConfig.FRAME_SKIP_INTERVAL
     
-    def process(self, video_path: str) -> None:
+    def process(self, video_path: str, use_gpu_decode: bool = PipelineConfig.USE_HW_DECODE) -> None:
         """
         Process a video file or camera stream.
         
         Args:
             video_path: Path to video file or camera index
+            use_gpu_decode: Request hardware-accelerated decoding when available
         """
-        cap = cv2.VideoCapture(video_path)
+        cap = self._open_capture(video_path, use_gpu_decode)
         
         if not cap.isOpened():
             print(f"✗ Cannot open video: {video_path}")
@@ -187,83 +293,414 @@ class VideoProcessor:
         print(f"FPS: {fps}")
         print(f"Frames: {total_frames}")
         
-        stats = self._process_frames(cap, total_frames)
+        # JIT-compile the geometry kernels now rather than on the first frame
+        warm_up_kernels()
         
-        cap.release()
+        try:
+            stats = self._process_frames(cap, total_frames, video_path)
+        finally:
+            cap.release()
         
         self._print_summary(stats)
     
-    def _process_frames(self, cap: cv2.VideoCapture, total_frames: int) -> dict:
+    def _open_capture(self, video_path, use_gpu_decode: bool) -> cv2.VideoCapture:
+        """
+        Open a capture, preferring FFmpeg hardware decoding (NVDEC, VA-API, ...).
+        
+        Camera indices, OpenCV builds without the acceleration properties and
+        sources FFmpeg cannot open all use the default CPU capture.
+        
+        Args:
+            video_path: Path, URL or camera index passed to VideoCapture
+            use_gpu_decode: Request hardware-accelerated decoding
+            
+        Returns:
+            Opened (or unopened, on failure) video capture object
+        """
+        is_camera = isinstance(video_path, int) or str(video_path).isdigit()
+        
+        if use_gpu_decode and not is_camera and hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            cap = cv2.VideoCapture(
+                video_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        
+        return cv2.VideoCapture(video_path)
+    
+    def _process_frames(self,
+                        cap: cv2.VideoCapture,
+                        total_frames: int,
+                        video_path=None) -> dict:
         """
         Process all frames in the video.
         
+        Runs as a three-stage pipeline connected by bounded queues:
+        a reader thread decodes and samples frames, a thread pool runs the
+        Azure AI Vision calls concurrently, and a writer thread annotates
+        and saves alert images. Analysis results are consumed in frame
+        order so person tracking sees a consistent sequence.
+        
         Args:
             cap: OpenCV video capture object
             total_frames: Total number of frames
+            video_path: Source the capture was opened from (selects buffering)
             
         Returns:
             Processing statistics dictionary
         """
-        frame_num = 0
         processed = 0
         alert_count = 0
+        max_in_flight = self._batch_size
+        pending = deque()
+        last_future = None
+        last_hash = None
+        unchanged_count = 0
+        max_distance = PipelineConfig.UNCHANGED_FRAME_HASH_DISTANCE
+        
+        # Live feeds keep only the newest frame; files must not lose any
+        if self._is_live_source(video_path):
+            frame_queue = LatestFrameSlot()
+        else:
+            frame_queue = queue.Queue(maxsize=PipelineConfig.FRAME_QUEUE_SIZE)
+        alert_queue = queue.Queue(maxsize=PipelineConfig.ALERT_QUEUE_SIZE)
+        stop = threading.Event()
+        reader_stats = {'total_frames': 0}
+        self._current_skip = TrackingConfig.FRAME_SKIP_INTERVAL
+        
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(cap, total_frames, frame_queue, stop, reader_stats),
+            daemon=True
+        )
+        writer = threading.Thread(
+            target=self._write_alert_images,
+            args=(alert_queue,),
+            daemon=True
+        )
+        reader.start()
+        writer.start()
         
         try:
-            while True:
-                ret, frame = cap.read()
+            with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+                completed = False
+                try:
+                    while True:
+                        item = frame_queue.get()
+                        if item is None:
+                            break
+                        
+                        frame, frame_num, frame_hash = item
+                        
+                        # Compare against the frame behind last_future, which
+                        # may not be the last one read if the slot dropped frames
+                        unchanged = (
+                            frame_hash is not None and last_hash is not None
+                            and bin(frame_hash ^ last_hash).count('1') < max_distance
+                        )
+                        if unchanged:
+                            unchanged_count += 1
+                            # Re-apply the last analysis instead of calling the API
+                            pending.append((frame, frame_num, last_future, True))
+                        else:
+                            last_future = executor.submit(self._request_analysis, frame, frame_num)
+                            last_hash = frame_hash
+                            pending.append((frame, frame_num, last_future, False))
+                            processed += 1
+                        
+                        # Bound the look-ahead; finish the oldest frame first
+                        if len(pending) >= max_in_flight:
+                            alert_count += self._finish_oldest(pending, alert_queue, stop)
+                    
+                    while pending:
+                        alert_count += self._finish_oldest(pending, alert_queue, stop)
+                    completed = True
+                
+                except KeyboardInterrupt:
+                    print("\n✗ Interrupted by user")
+                
+                finally:
+                    if not completed:
+                        # Stop the reader and drop requests not yet started
+                        stop.set()
+                        for _, _, future, _ in pending:
+                            future.cancel()
+        finally:
+            # Let the writer drain queued alert images, even after an error
+            alert_queue.put(None)
+            writer.join()
+            reader.join()
+        
+        return {
+            'total_frames': reader_stats['total_frames'],
+            'processed': processed,
+            'dropped': getattr(frame_queue, 'dropped', 0),
+            'unchanged': unchanged_count,
+            'alert_count': alert_count
+        }
+    
+    def _read_frames(self,
+                     cap: cv2.VideoCapture,
+                     total_frames: int,
+                     frame_queue: queue.Queue,
+                     stop: threading.Event,
+                     reader_stats: dict) -> None:
+        """
+        Decode frames and queue the sampled ones (runs on the reader thread).
+        
+        Blocks while the queue is full, so a slow API throttles decoding
+        instead of growing memory. Each sampled frame carries its dHash
+        (None when the unchanged-frame check is off) so the consumer can
+        tell whether it matches the last analyzed frame. A None sentinel
+        marks the end of input.
+        
+        Args:
+            cap: OpenCV video capture object
+            total_frames: Total number of frames
+            frame_queue: Queue receiving (frame, frame_num, frame_hash) tuples
+            stop: Event set when processing is aborted
+            reader_stats: Dictionary receiving the number of frames read
+        """
+        frame_num = 0
+        next_sample = 0
+        hash_frames = PipelineConfig.UNCHANGED_FRAME_HASH_DISTANCE > 0
+        
+        try:
+            while not stop.is_set():
+                # Process selected frames only to reduce API costs; the rest
+                # are only grabbed, skipping pixel decode and conversion
+                sampled = frame_num >= next_sample
+                
+                if sampled:
+                    next_sample = frame_num + self._current_skip
+                    ret, frame = cap.read()
+                else:
+                    ret = cap.grab()
                 
                 if not ret:
                     print("\n[OK] Video complete")
                     break
                 
-                # Process selected frames only to reduce API costs
-                if frame_num % TrackingConfig.FRAME_SKIP_INTERVAL == 0:
-                    alert_count += self._process_single_frame(
-                        frame, 
-                        frame_num
-                    )
-                    processed += 1
+                if sampled:
+                    # Hashed here so the main thread only compares bits
+                    frame_hash = self._frame_hash(frame) if hash_frames else None
+                    self._put_until_stopped(frame_queue, (frame, frame_num, frame_hash), stop)
                 
                 frame_num += 1
                 
                 # Progress update
                 if frame_num % 300 == 0:
                     self._print_progress(frame_num, total_frames)
+        finally:
+            # Always release the consumer, even if decoding failed
+            reader_stats['total_frames'] = frame_num
+            self._put_until_stopped(frame_queue, None, stop)
+    
+    @staticmethod
+    def _frame_hash(frame: np.ndarray) -> int:
+        """
+        Compute a 64-bit difference hash (dHash) of a frame.
         
-        except KeyboardInterrupt:
-            print("\n✗ Interrupted by user")
+        Each bit records whether a pixel of a 9x8 grayscale thumbnail is
+        brighter than its right-hand neighbour, so the hash ignores
+        compression noise and small exposure changes.
         
-        return {
-            'total_frames': frame_num,
-            'processed': processed,
-            'alert_count': alert_count
-        }
+        Args:
+            frame: BGR frame image array
+            
+        Returns:
+            Hash as an integer
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+    
+    def _put_until_stopped(self, target: queue.Queue, item, stop: threading.Event) -> bool:
+        """
+        Put an item on a bounded queue, giving up if processing is aborted.
+        
+        Args:
+            target: Queue to put the item on
+            item: Item to enqueue
+            stop: Event set when processing is aborted
+            
+        Returns:
+            True if the item was enqueued
+        """
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _write_alert_images(self, alert_queue: queue.Queue) -> None:
+        """
+        Annotate and save queued alert images (runs on the writer thread).
+        
+        A failure to save one image is reported and skipped, so the thread
+        keeps draining the queue and never blocks the producer.
+        
+        Args:
+            alert_queue: Queue of (frame, alert, frame_num) tuples, None to stop
+        """
+        while True:
+            item = alert_queue.get()
+            if item is None:
+                break
+            try:
+                self._save_alert_image(*item)
+            except Exception as e:
+                print(f"✗ Error saving alert image for frame {item[2]}: {str(e)}")
+    
+    def _is_live_source(self, video_path) -> bool:
+        """
+        Check whether a capture source is a live camera or network stream.
+        
+        Args:
+            video_path: Path, URL or camera index passed to VideoCapture
+            
+        Returns:
+            True for camera indices and streaming URLs
+        """
+        if isinstance(video_path, int):
+            return True
+        
+        source = str(video_path).lower()
+        return source.isdigit() or source.startswith(PipelineConfig.LIVE_STREAM_PREFIXES)
     
-    def _process_single_frame(self, frame: np.ndarray, frame_num: int) -> int:
+    def _request_analysis(self, frame: np.ndarray, frame_num: int):
         """
-        Process a single video frame.
+        Fetch the Azure AI Vision analysis for one frame (runs on a worker thread).
+        
+        The frame is JPEG-encoded in memory and sent directly, with no
+        temporary file. Frames larger than PipelineConfig.MAX_ANALYSIS_EDGE_PX
+        are downscaled first to cut encode time and upload size.
         
         Args:
             frame: Frame image array
             frame_num: Frame number
             
+        Returns:
+            Tuple of (Azure AI Vision analysis result, factor mapping its
+            coordinates back to the full-resolution frame)
+        """
+        scale = 1.0
+        max_edge = PipelineConfig.MAX_ANALYSIS_EDGE_PX
+        height, width = frame.shape[:2]
+        if max_edge > 0 and max(height, width) > max_edge:
+            shrink = max_edge / max(height, width)
+            frame = cv2.resize(
+                frame,
+                (max(1, round(width * shrink)), max(1, round(height * shrink))),
+                interpolation=cv2.INTER_AREA
+            )
+            scale = width / frame.shape[1]
+        
+        ok, encoded = cv2.imencode(
+            '.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, PipelineConfig.FRAME_JPEG_QUALITY]
+        )
+        if not ok:
+            raise ValueError(f"Could not encode frame {frame_num}")
+        
+        analysis_result = self._orchestrator.vision_analyzer.analyze_image_bytes(encoded.tobytes())
+        return analysis_result, scale
+    
+    def _finish_oldest(self,
+                       pending: deque,
+                       alert_queue: queue.Queue,
+                       stop: threading.Event) -> int:
+        """
+        Complete the oldest in-flight frame and adapt the sampling interval.
+        
+        Args:
+            pending: Deque of (frame, frame_num, future, unchanged) in frame order
+            alert_queue: Queue feeding the alert image writer
+            stop: Event set when processing is aborted
+            
         Returns:
             Number of alerts generated
         """
-        # Save frame temporarily
-        temp_file = os.path.join(self._output_dir, FilePaths.TEMP_FRAME_FILE)
-        cv2.imwrite(temp_file, frame)
+        alert_count = self._complete_frame(*pending.popleft(), alert_queue, stop)
+        if PipelineConfig.ADAPTIVE_FRAME_SKIP:
+            self._adapt_frame_skip(alert_count)
+        return alert_count
+    
+    def _adapt_frame_skip(self, alert_count: int) -> None:
+        """
+        Sample more densely around alerts and back off on quiet footage.
         
-        # Analyze frame
-        alerts = self._orchestrator.analyze_frame(temp_file, frame_num)
+        The reader picks up the new interval when it schedules its next
+        sample, so frames already queued or in flight are unaffected.
         
-        # Handle alerts
-        for alert in alerts:
-            self._save_alert_image(frame, alert, frame_num)
+        Args:
+            alert_count: Alerts generated by the frame just completed
+        """
+        if alert_count > 0:
+            skip = max(PipelineConfig.MIN_FRAME_SKIP_INTERVAL, self._current_skip // 2)
+        else:
+            skip = min(
+                PipelineConfig.MAX_FRAME_SKIP_INTERVAL,
+                self._current_skip + max(1, self._current_skip // 4)
+            )
+        self._current_skip = skip
+    
+    def _complete_frame(self,
+                        frame: np.ndarray,
+                        frame_num: int,
+                        future: Future,
+                        unchanged: bool,
+                        alert_queue: queue.Queue,
+                        stop: threading.Event) -> int:
+        """
+        Run detection on a fetched analysis and queue its alert images.
         
-        # Clean up
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        Unchanged frames reuse the previous frame's analysis: tracks are
+        refreshed and loitering re-checked, but alerts the analysis already
+        raised are not raised again.
+        
+        Args:
+            frame: Frame image array
+            frame_num: Frame number
+            future: Future holding the frame's analysis result
+            unchanged: Whether the future belongs to an earlier, identical frame
+            alert_queue: Queue feeding the alert image writer
+            stop: Event set when processing is aborted
+            
+        Returns:
+            Number of alerts generated
+        """
+        try:
+            analysis_result, scale = future.result()
+        except Exception as e:
+            if not unchanged:
+                print(f"✗ Error during analysis of frame {frame_num}: {str(e)}")
+            return 0
+        
+        # Frames never touch disk, so alerts are labelled by frame number
+        if unchanged:
+            alerts = self._orchestrator.repeat_analysis_result(
+                analysis_result,
+                f"frame_{frame_num}",
+                frame_num,
+                scale
+            )
+        else:
+            alerts = self._orchestrator.process_analysis_result(
+                analysis_result,
+                f"frame_{frame_num}",
+                frame_num,
+                scale
+            )
+        
+        # Annotation and disk writes happen on the writer thread
+        for alert in alerts:
+            self._put_until_stopped(alert_queue, (frame, alert, frame_num), stop)
         
         return len(alerts)
     
@@ -292,6 +729,10 @@ class VideoProcessor:
         """
         Add annotations to frame for alert visualization.
         
+        The frame is copied into a canvas reused across calls rather than
+        a fresh array per alert, so the result is only valid until the
+        next call.
+        
         Args:
             frame: Frame image array
             alert: TheftAlert object
@@ -299,23 +740,25 @@ class VideoProcessor:
         Returns:
             Annotated frame
         """
-        annotated = frame.copy()
-        
-        # Draw bounding boxes
-        for bbox in alert.bounding_boxes:
-            x, y, w, h = bbox['x'], bbox['y'], bbox['width'], bbox['height']
-            cv2.rectangle(annotated, (x, y), (x+w, y+h), (0, 0, 255), 2)
-        
-        # Add text overlay
-        cv2.putText(
-            annotated, 
-            f"{alert.alert_type} - {alert.severity}", 
-            (10, 30), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            1, 
-            (0, 0, 255), 
-            2
-        )
+        if (self._scratch is None or self._scratch.shape != frame.shape
+                or self._scratch.dtype != frame.dtype):
+            self._scratch = np.empty_like(frame)
+        annotated = self._scratch
+        np.copyto(annotated, frame)
+        
+        # Draw bounding boxes as closed outlines in a single polylines call
+        if alert.bounding_boxes:
+            boxes = np.array([
+                (bbox['x'], bbox['y'], bbox['width'], bbox['height'])
+                for bbox in alert.bounding_boxes
+            ], dtype=np.int32)
+            x, y, w, h = boxes.T
+            corners = np.stack((x, y, x + w, y, x + w, y + h, x, y + h), axis=1)
+            cv2.polylines(annotated, list(corners.reshape(-1, 4, 1, 2)), True, (0, 0, 255), 2)
+        
+        # Add text overlay; the headline repeats per alert type, so its
+        # rasterized pixels are reused instead of drawn again
+        self._blend_banner(annotated, f"{alert.alert_type} - {alert.severity}", (0, 0, 255))
         
         cv2.putText(
             annotated, 
@@ -329,6 +772,35 @@ class VideoProcessor:
         
         return annotated
     
+    def _blend_banner(self, image: np.ndarray, text: str, color) -> None:
+        """
+        Paint an alert headline at the image's top left, as cv2.putText would.
+        
+        The text is rasterized once per distinct headline into a coverage
+        mask, which is then blended into each image in place.
+        
+        Args:
+            image: BGR image to draw on
+            text: Headline text
+            color: BGR text color
+        """
+        coverage = self._banner_cache.get(text)
+        if coverage is None:
+            (text_width, _), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
+            coverage = np.zeros((30 + baseline + 4, 10 + text_width + 4), dtype=np.uint8)
+            cv2.putText(coverage, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, 255, 2)
+            self._banner_cache[text] = coverage
+        
+        height = min(coverage.shape[0], image.shape[0])
+        width = min(coverage.shape[1], image.shape[1])
+        alpha = coverage[:height, :width, None].astype(np.uint16)
+        region = image[:height, :width].astype(np.uint16)
+        
+        # Rounded integer blend: region + (color - region) * alpha / 255
+        region *= 255 - alpha
+        region += np.array(color, dtype=np.uint16) * alpha + 127
+        image[:height, :width] = region // 255
+    
     def _print_progress(self, frame_num: int, total_frames: int) -> None:
         """Print processing progress."""
         progress = (frame_num / total_frames * 100) if total_frames > 0 else 0
@@ -341,6 +813,10 @@ class VideoProcessor:
         print(f"{'='*70}")
         print(f"Total frames: {stats['total_frames']}")
         print(f"Analyzed: {stats['processed']}")
+        if stats.get('dropped'):
+            print(f"Dropped (stale live frames): {stats['dropped']}")
+        if stats.get('unchanged'):
+            print(f"Skipped (unchanged scene): {stats['unchanged']}")
         print(f"Alerts: {stats['alert_count']}")
         print(f"Output: {self._output_dir}")
         print(f"{'='*70}\n")
@@ -373,7 +849,15 @@ def create_demo_image(filename: str = FilePaths.DEMO_IMAGE_FILE) -> str:
     cv2.putText(img, "Person", (80, 250), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
     cv2.putText(img, "EXIT", (555, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
     
-    cv2.imwrite(filename, img)
+    # Flat synthetic colors compress well with run-length encoding, which
+    # is much cheaper than the default zlib strategy (JPEG ignores these)
+    params = []
+    if filename.lower().endswith('.png'):
+        params = [
+            cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+            cv2.IMWRITE_PNG_COMPRESSION, 1
+        ]
+    cv2.imwrite(filename, img, params)
     
     return filename
 
@@ -17,6 +17,10 @@ except ImportError:
     from config import ValidationRules
 
 
+# Hashed lookup for the per-alert severity check
+_VALID_SEVERITIES = frozenset(ValidationRules.VALID_SEVERITY_LEVELS)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
@@ -62,6 +66,27 @@ def validate_confidence_score(confidence: float) -> None:
         )
 
 
+def validate_alert_fields(severity: str, confidence: float) -> None:
+    """
+    Validate an alert's severity and confidence with one combined check.
+    
+    Valid alerts (the common case) pass a single condition; the specific
+    validators only run to report what was wrong.
+    
+    Args:
+        severity: Severity level string
+        confidence: Confidence score to validate
+        
+    Raises:
+        ValidationError: If severity or confidence is invalid
+    """
+    if isinstance(severity, str) and severity in _VALID_SEVERITIES and 0.0 <= confidence <= 1.0:
+        return
+    
+    validate_severity_level(severity)
+    validate_confidence_score(confidence)
+
+
 def validate_polygon(coordinates: List[Tuple[int, int]]) -> bool:
     """
     Validate that polygon coordinates form a valid polygon.
@@ -98,7 +123,8 @@ def validate_severity_level(severity: str) -> None:
     Raises:
         ValidationError: If severity is not a valid level
     """
-    if severity not in ValidationRules.VALID_SEVERITY_LEVELS:
+    # Unhashable values would make the set lookup raise TypeError
+    if not isinstance(severity, str) or severity not in _VALID_SEVERITIES:
         raise ValidationError(
             f"Invalid severity level: {severity}. "
             f"Must be one of {ValidationRules.VALID_SEVERITY_LEVELS}"
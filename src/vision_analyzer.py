@@ -7,16 +7,24 @@ Handles all interactions with Azure AI Vision API following Single Responsibilit
 Author: AI-102 Study Implementation
 """
 
-from typing import List
+from typing import List, Optional
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from azure.ai.vision.imageanalysis import ImageAnalysisClient
-from azure.ai.vision.imageanalysis.models import VisualFeatures
+from azure.ai.vision.imageanalysis.models import ImageAnalysisResult, VisualFeatures
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 
 try:
-    from .validators import validate_azure_endpoint, validate_azure_key, validate_file_exists
+    from .validators import validate_azure_endpoint, validate_azure_key, ValidationError
     from .config import AzureVisionConfig
 except ImportError:
-    from validators import validate_azure_endpoint, validate_azure_key, validate_file_exists
+    from validators import validate_azure_endpoint, validate_azure_key, ValidationError
     from config import AzureVisionConfig
 
 
@@ -28,13 +36,19 @@ class VisionAnalyzer:
     and returning analysis results.
     """
     
-    def __init__(self, endpoint: str, key: str):
+    def __init__(self,
+                 endpoint: str,
+                 key: str,
+                 cache_dir: Optional[str] = AzureVisionConfig.RESULT_CACHE_DIR,
+                 quiet: bool = False):
         """
         Initialize the Azure AI Vision analyzer.
         
         Args:
             endpoint: Azure AI Vision endpoint URL
             key: Azure AI Vision subscription key
+            cache_dir: Optional directory persisting analysis results across runs
+            quiet: Skip the per-request console summary
             
         Raises:
             ValidationError: If endpoint or key format is invalid
@@ -44,13 +58,41 @@ class VisionAnalyzer:
         
         self._client = ImageAnalysisClient(
             endpoint=endpoint,
-            credential=AzureKeyCredential(key)
+            credential=AzureKeyCredential(key),
+            transport=self._create_transport()
         )
         self._endpoint = endpoint
+        self._quiet = quiet
+        self._visual_features = self._resolve_visual_features()
+        
+        # Results keyed by image content; workers share it, hence the lock
+        self._result_cache: "OrderedDict[bytes, ImageAnalysisResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
         
         print(f"✓ Vision Analyzer initialized")
         print(f"  Endpoint: {endpoint}")
     
+    @staticmethod
+    def _create_transport() -> RequestsTransport:
+        """
+        Create an HTTP transport backed by one pooled keep-alive session.
+        
+        The default pool holds 10 connections, so concurrent video workers
+        beyond that would open fresh TLS connections for each request. The
+        transport owns the session and closes it with the client.
+        
+        Returns:
+            RequestsTransport for the ImageAnalysisClient
+        """
+        pool_size = AzureVisionConfig.CONNECTION_POOL_SIZE
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+        
+        return RequestsTransport(session=session, session_owner=True)
+    
     def analyze_image(self, image_path: str):
         """
         Analyze an image using Azure AI Vision.
@@ -65,11 +107,38 @@ class VisionAnalyzer:
             ValidationError: If image file doesn't exist
             Exception: If Azure API call fails
         """
-        validate_file_exists(image_path)
+        image_data = self._read_image_file(image_path)
         
-        print(f"→ Analyzing image with Azure AI Vision...")
+        return self.analyze_image_bytes(image_data)
+    
+    def analyze_image_bytes(self, image_data: bytes):
+        """
+        Analyze already-encoded image data using Azure AI Vision.
+        
+        Lets callers holding frames in memory skip the disk round trip.
+        Identical image bytes analyzed before are answered from the
+        result cache without calling Azure.
+        
+        Args:
+            image_data: Encoded image bytes (e.g. JPEG)
+            
+        Returns:
+            ImageAnalysisResult from Azure AI Vision
+            
+        Raises:
+            Exception: If Azure API call fails
+        """
+        cache_key = hashlib.blake2b(image_data, digest_size=16).digest()
+        result = self._get_cached_result(cache_key)
+        if result is not None:
+            if not self._quiet:
+                print(f"→ Using cached Azure AI Vision result")
+                self._log_analysis_result(result)
+            return result
+        
+        if not self._quiet:
+            print(f"→ Analyzing image with Azure AI Vision...")
         
-        image_data = self._read_image_file(image_path)
         visual_features = self._get_visual_features()
         
         result = self._client.analyze(
@@ -77,41 +146,133 @@ class VisionAnalyzer:
             visual_features=visual_features
         )
         
-        self._log_analysis_result(result)
+        self._store_cached_result(cache_key, result)
+        if not self._quiet:
+            self._log_analysis_result(result)
+        
+        return result
+    
+    def _get_cached_result(self, cache_key: bytes) -> Optional[ImageAnalysisResult]:
+        """
+        Look up a cached analysis result, falling back to the cache directory.
+        
+        Args:
+            cache_key: Digest of the image bytes
+            
+        Returns:
+            Cached ImageAnalysisResult, or None on a miss
+        """
+        with self._cache_lock:
+            result = self._result_cache.get(cache_key)
+            if result is not None:
+                self._result_cache.move_to_end(cache_key)
+                return result
+        
+        if not self._cache_dir:
+            return None
+        
+        try:
+            with open(self._cache_path(cache_key), 'r', encoding='utf-8') as f:
+                result = ImageAnalysisResult(json.load(f))
+        except (OSError, ValueError):
+            return None
         
+        self._remember_result(cache_key, result)
         return result
     
+    def _store_cached_result(self, cache_key: bytes, result) -> None:
+        """
+        Cache an analysis result in memory and, if configured, on disk.
+        
+        Disk writes are best effort; a failed write only costs a future miss.
+        
+        Args:
+            cache_key: Digest of the image bytes
+            result: ImageAnalysisResult from Azure AI Vision
+        """
+        self._remember_result(cache_key, result)
+        
+        if not self._cache_dir:
+            return
+        
+        path = self._cache_path(cache_key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(result.as_dict(), f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, AttributeError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def _remember_result(self, cache_key: bytes, result) -> None:
+        """
+        Add a result to the in-memory LRU cache, evicting the oldest entry when full.
+        
+        Args:
+            cache_key: Digest of the image bytes
+            result: ImageAnalysisResult from Azure AI Vision
+        """
+        if AzureVisionConfig.RESULT_CACHE_SIZE <= 0:
+            return
+        
+        with self._cache_lock:
+            self._result_cache[cache_key] = result
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > AzureVisionConfig.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _cache_path(self, cache_key: bytes) -> str:
+        """Path of the cache file holding the result for a digest."""
+        return os.path.join(self._cache_dir, f"{cache_key.hex()}.json")
+    
     def _read_image_file(self, image_path: str) -> bytes:
         """
         Read image file as binary data.
         
+        Opening the file directly doubles as the existence check, saving
+        a separate stat call per image.
+        
         Args:
             image_path: Path to image file
             
         Returns:
             Binary image data
+            
+        Raises:
+            ValidationError: If image file doesn't exist
         """
-        with open(image_path, 'rb') as f:
-            return f.read()
+        try:
+            with open(image_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise ValidationError(f"File not found: {image_path}") from None
     
     def _get_visual_features(self) -> List[VisualFeatures]:
         """
         Get the list of visual features to request from Azure.
         
         Returns:
-            List of VisualFeatures enums
+            List of VisualFeatures enums, resolved once at construction
+        """
+        return self._visual_features
+    
+    @staticmethod
+    def _resolve_visual_features() -> List[VisualFeatures]:
         """
-        feature_map = {
-            'PEOPLE': VisualFeatures.PEOPLE,
-            'OBJECTS': VisualFeatures.OBJECTS,
-            'TAGS': VisualFeatures.TAGS,
-            'CAPTION': VisualFeatures.CAPTION
-        }
+        Map the configured feature names to VisualFeatures enums.
+        
+        Names the SDK does not know are skipped.
         
+        Returns:
+            List of VisualFeatures enums
+        """
         return [
-            feature_map[feature_name]
+            VisualFeatures[feature_name]
             for feature_name in AzureVisionConfig.VISUAL_FEATURES_REQUESTED
-            if feature_name in feature_map
+            if feature_name in VisualFeatures.__members__
         ]
     
     def _log_analysis_result(self, result) -> None:
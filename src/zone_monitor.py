@@ -7,16 +7,24 @@ Handles monitoring of detection zones and zone violations following SRP.
 Author: AI-102 Study Implementation
 """
 
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+import sys
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 
 try:
-    from .geometry_utils import point_in_polygon, calculate_bounding_box_center
-    from .config import DefaultZones, ZoneDefinition
+    from .geometry_utils import (
+        point_in_polygon, points_in_polygon, polygon_box_overlap, calculate_bounding_box_center,
+        NUMBA_AVAILABLE, _point_in_polygon_kernel
+    )
+    from .config import DefaultZones, ZoneDefinition, DetectionThresholds
     from .validators import validate_polygon
 except ImportError:
-    from geometry_utils import point_in_polygon, calculate_bounding_box_center
-    from config import DefaultZones, ZoneDefinition
+    from geometry_utils import (
+        point_in_polygon, points_in_polygon, polygon_box_overlap, calculate_bounding_box_center,
+        NUMBA_AVAILABLE, _point_in_polygon_kernel
+    )
+    from config import DefaultZones, ZoneDefinition, DetectionThresholds
     from validators import validate_polygon
 
 
@@ -37,16 +45,40 @@ class DetectionZone:
     is_restricted: bool = False
     alert_on_loitering: bool = False
     max_loiter_seconds: int = 120
+    extent: Tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    rect_bounds: Optional[Tuple[float, float, float, float]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    is_exit: bool = field(init=False, repr=False, compare=False, default=False)
+    _polygon: Optional[np.ndarray] = field(init=False, repr=False, compare=False, default=None)
     
     def __post_init__(self):
         """Validate zone data after initialization."""
         if not validate_polygon(self.coordinates):
             raise ValueError(f"Invalid polygon coordinates for zone '{self.name}'")
+        
+        # Interned so alert and report keys built from zone names share one object
+        self.name = sys.intern(self.name)
+        xs = [x for x, _ in self.coordinates]
+        ys = [y for _, y in self.coordinates]
+        self.extent = (float(min(xs)), float(min(ys)), float(max(xs)), float(max(ys)))
+        self.rect_bounds = _axis_aligned_rectangle_bounds(self.coordinates)
+        if NUMBA_AVAILABLE and self.rect_bounds is None:
+            self._polygon = np.asarray(self.coordinates, dtype=np.float64)
+        
+        # Zone names are fixed, so exit detection is resolved once here
+        self.is_exit = 'exit' in self.name.lower()
     
     def contains_point(self, x: int, y: int) -> bool:
         """
         Check if a point is within this zone.
         
+        Axis-aligned rectangles use four comparisons. Other shapes reject
+        points outside their extent, then ray cast (by the compiled kernel
+        when numba is available).
+        
         Args:
             x: X coordinate
             y: Y coordinate
@@ -54,6 +86,16 @@ class DetectionZone:
         Returns:
             True if point is inside zone
         """
+        if self.rect_bounds is not None:
+            min_x, min_y, max_x, max_y = self.rect_bounds
+            return min_x < x <= max_x and min_y < y <= max_y
+        
+        min_x, min_y, max_x, max_y = self.extent
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            return False
+        
+        if self._polygon is not None:
+            return bool(_point_in_polygon_kernel(float(x), float(y), self._polygon))
         return point_in_polygon((x, y), self.coordinates)
     
     def contains_bounding_box(self, bounding_box: dict) -> bool:
@@ -70,6 +112,34 @@ class DetectionZone:
         return self.contains_point(int(center_x), int(center_y))
 
 
+def _axis_aligned_rectangle_bounds(coordinates: List[Tuple[int, int]]
+                                   ) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Detect zones that are axis-aligned rectangles.
+    
+    Args:
+        coordinates: Zone polygon vertices
+        
+    Returns:
+        (min_x, min_y, max_x, max_y) for a rectangle, None for any other shape
+    """
+    if len(coordinates) != 4:
+        return None
+    
+    xs = {x for x, _ in coordinates}
+    ys = {y for _, y in coordinates}
+    if len(xs) != 2 or len(ys) != 2:
+        return None
+    
+    # Every edge must be horizontal or vertical (rules out a crossed ordering)
+    vertices = list(coordinates)
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        if x1 != x2 and y1 != y2:
+            return None
+    
+    return (float(min(xs)), float(min(ys)), float(max(xs)), float(max(ys)))
+
+
 class ZoneMonitor:
     """
     Monitors detection zones and identifies zone-based violations.
@@ -92,6 +162,8 @@ class ZoneMonitor:
         else:
             self._zones = zones
         
+        self._refresh_zone_polygons()
+        
         print(f"✓ Zone Monitor initialized with {len(self._zones)} zone(s)")
     
     def find_zone_for_point(self, x: int, y: int) -> Optional[DetectionZone]:
@@ -123,6 +195,100 @@ class ZoneMonitor:
         center_x, center_y = calculate_bounding_box_center(bounding_box)
         return self.find_zone_for_point(int(center_x), int(center_y))
     
+    def find_zones_for_points(self, points) -> List[Optional[DetectionZone]]:
+        """
+        Find the zone containing each of many points in one vectorized pass.
+        
+        Args:
+            points: Sequence or array of (x, y) coordinates
+            
+        Returns:
+            List with the first matching DetectionZone (or None) per point
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        
+        if not self._zones or len(points) == 0:
+            return [None] * len(points)
+        
+        # inside[i, j]: point i lies in zone j; only points within a zone's
+        # extent are ray cast against it
+        inside = np.zeros((len(points), len(self._zones)), dtype=bool)
+        for j, (zone, polygon, bounds) in enumerate(
+                zip(self._zones, self._zone_polygons, self._zone_bounds)):
+            if zone.rect_bounds is not None:
+                # Rectangle: the extent test is the exact answer
+                inside[:, j] = np.all((points > bounds[:2]) & (points <= bounds[2:]), axis=1)
+                continue
+            
+            within = np.all((points >= bounds[:2]) & (points <= bounds[2:]), axis=1)
+            if within.any():
+                inside[within, j] = points_in_polygon(points[within], polygon)
+        first_zone = inside.argmax(axis=1)
+        has_zone = inside.any(axis=1)
+        
+        return [
+            self._zones[index] if found else None
+            for index, found in zip(first_zone.tolist(), has_zone.tolist())
+        ]
+    
+    def find_zones_for_bounding_boxes(self, bounding_boxes: List[Dict]) -> List[Optional[DetectionZone]]:
+        """
+        Find the zone containing each bounding box center.
+        
+        Args:
+            bounding_boxes: List of dictionaries with x, y, width, height
+            
+        Returns:
+            List with the matching DetectionZone (or None) per bounding box
+        """
+        centers = [calculate_bounding_box_center(bbox) for bbox in bounding_boxes]
+        
+        # Truncate like find_zone_for_bounding_box's int() conversion
+        return self.find_zones_for_points(np.trunc(np.asarray(centers, dtype=np.float64)))
+    
+    def find_zones_by_overlap(self,
+                              bounding_boxes: List[Dict],
+                              min_overlap: float = DetectionThresholds.MIN_ZONE_OVERLAP
+                              ) -> List[Optional[DetectionZone]]:
+        """
+        Assign each bounding box to the zone covering most of its area.
+        
+        Unlike the center-point lookups, a box straddling a zone edge is
+        judged by how much of it actually lies in the zone. Zones whose
+        extent does not touch the box are skipped before any clipping.
+        
+        Args:
+            bounding_boxes: List of dictionaries with x, y, width, height
+            min_overlap: Fraction of the box that must lie inside the zone
+            
+        Returns:
+            List with the best-overlapping DetectionZone (or None) per box
+        """
+        if not self._zones:
+            return [None] * len(bounding_boxes)
+        
+        zones = []
+        for bbox in bounding_boxes:
+            x_min, y_min = bbox['x'], bbox['y']
+            x_max, y_max = x_min + bbox['width'], y_min + bbox['height']
+            
+            # Extent pre-filter: only zones whose bounds intersect the box
+            candidates = np.flatnonzero(
+                (self._zone_bounds[:, 0] < x_max) & (self._zone_bounds[:, 2] > x_min) &
+                (self._zone_bounds[:, 1] < y_max) & (self._zone_bounds[:, 3] > y_min)
+            )
+            
+            best_zone = None
+            best_overlap = min_overlap
+            for index in candidates.tolist():
+                overlap = polygon_box_overlap(self._zone_polygons[index], bbox)
+                if overlap > best_overlap:
+                    best_zone, best_overlap = self._zones[index], overlap
+            
+            zones.append(best_zone)
+        
+        return zones
+    
     def is_in_restricted_zone(self, x: int, y: int) -> bool:
         """
         Check if a point is in a restricted zone.
@@ -168,6 +334,19 @@ class ZoneMonitor:
             zone: DetectionZone to add
         """
         self._zones.append(zone)
+        self._refresh_zone_polygons()
+    
+    def _refresh_zone_polygons(self) -> None:
+        """Cache zone vertices and extents as float arrays for vectorized lookups."""
+        self._zone_polygons = [
+            np.asarray(zone.coordinates, dtype=np.float64)
+            for zone in self._zones
+        ]
+        
+        # (min_x, min_y, max_x, max_y) per zone for cheap candidate filtering
+        self._zone_bounds = np.array(
+            [zone.extent for zone in self._zones], dtype=np.float64
+        ).reshape(-1, 4)
     
     def _create_default_zones(self) -> List[DetectionZone]:
         """
@@ -23,11 +23,15 @@ import unittest
 import os
 import json
 import logging
+import logging.handlers
 import tempfile
+import threading
 import shutil
-import time
+import io
+import contextlib
 from unittest.mock import Mock, MagicMock, patch, call
 from datetime import datetime
+from types import SimpleNamespace
 from typing import List, Dict
 
 import numpy as np
@@ -40,17 +44,55 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from retail_theft_detection import (
     RetailTheftDetector,
+    VideoProcessor,
+    LatestFrameSlot,
     DetectionZone,
     TheftAlert,
     ThreatLevel
 )
+from detection_orchestrator import DetectionOrchestrator
+from zone_monitor import ZoneMonitor
+from alert_manager import AlertManager
+from geometry_utils import (
+    point_in_polygon, calculate_path_distance, polygon_box_overlap,
+    _point_in_polygon_kernel, _points_in_polygon_kernel, _box_path_length_kernel
+)
+from person_tracker import PersonTracker, PersonTrackingData, SCIPY_AVAILABLE
+from validators import ValidationError
+from config import TrackingConfig
+from behavior_analyzer import BehaviorAnalyzer
+from vision_analyzer import VisionAnalyzer
+from azure.ai.vision.imageanalysis.models import ImageAnalysisResult, VisualFeatures
 
 from logging_instrumentation import (
     TheftDetectionLogger,
-    PerformanceMonitor
+    PerformanceMonitor,
+    MetricRingBuffer,
+    retry_on_error
+)
+
+
+# Canned Azure result: one person standing in the default restricted area
+PERSON_IN_RESTRICTED_AREA_RESULT = SimpleNamespace(
+    people=SimpleNamespace(list=[
+        SimpleNamespace(
+            bounding_box=SimpleNamespace(x=50, y=450, width=50, height=100),
+            confidence=0.95
+        )
+    ]),
+    objects=SimpleNamespace(list=[]),
+    tags=SimpleNamespace(list=[]),
+    caption=SimpleNamespace(text="Person in store")
 )
 
 
+def _closing_logger(test_case: unittest.TestCase, **kwargs) -> TheftDetectionLogger:
+    """Build a TheftDetectionLogger that is closed when the test finishes."""
+    logger = TheftDetectionLogger(**kwargs)
+    test_case.addCleanup(logger.close)
+    return logger
+
+
 class TestDetectionZone(unittest.TestCase):
     """Test cases for DetectionZone data class."""
     
@@ -81,8 +123,256 @@ class TestDetectionZone(unittest.TestCase):
         self.assertFalse(zone.is_restricted)
         self.assertFalse(zone.alert_on_loitering)
         self.assertEqual(zone.max_loiter_seconds, 120)
+    
+    
+    def test_vectorized_zone_lookup_matches_scalar(self):
+        """Test that batched zone lookup agrees with the per-point lookup."""
+        monitor = ZoneMonitor([
+            DetectionZone(
+                name="L_Shape",
+                coordinates=[(0, 0), (100, 0), (100, 40), (40, 40), (40, 100), (0, 100)]
+            ),
+            DetectionZone(
+                name="Square",
+                coordinates=[(50, 50), (150, 50), (150, 150), (50, 150)]
+            )
+        ])
+        
+        points = [(x, y) for x in range(-10, 170, 10) for y in range(-10, 170, 10)]
+        batched = monitor.find_zones_for_points(points)
+        
+        l_shape = monitor.get_all_zones()[0]
+        for (x, y), zone in zip(points, batched):
+            self.assertIs(zone, monitor.find_zone_for_point(x, y), f"point {(x, y)}")
+            self.assertEqual(
+                l_shape.contains_point(x, y),
+                point_in_polygon((x, y), l_shape.coordinates),
+                f"point {(x, y)}"
+            )
+    
+    def test_rectangle_fast_path_matches_ray_cast(self):
+        """Test that rectangular zones skip the ray cast with identical results."""
+        rectangle = [(50, 50), (150, 50), (150, 150), (50, 150)]
+        bow_tie = [(50, 50), (150, 150), (150, 50), (50, 150)]
+        zone = DetectionZone(name="Square", coordinates=rectangle)
+        
+        self.assertIsNotNone(zone.rect_bounds)
+        self.assertIsNone(DetectionZone(name="Bow_Tie", coordinates=bow_tie).rect_bounds)
+        
+        # Includes points exactly on every edge and corner
+        points = [(x, y) for x in range(40, 170, 10) for y in range(40, 170, 10)]
+        batched = ZoneMonitor([zone]).find_zones_for_points(points)
+        for (x, y), found in zip(points, batched):
+            expected = point_in_polygon((x, y), rectangle)
+            self.assertEqual(zone.contains_point(x, y), expected, f"point {(x, y)}")
+            self.assertEqual(found is zone, expected, f"point {(x, y)}")
+    
+    def test_ray_cast_kernel_matches_vectorized(self):
+        """Test that the JIT kernel (or its interpreted fallback) matches the scalar ray cast."""
+        polygon = np.array([(0, 0), (100, 0), (100, 40), (40, 40), (40, 100), (0, 100)], dtype=np.float64)
+        points = np.array(
+            [(x, y) for x in range(-10, 120, 5) for y in range(-10, 120, 5)],
+            dtype=np.float64
+        )
+        
+        expected = [point_in_polygon(tuple(point), polygon.tolist()) for point in points]
+        
+        self.assertEqual(_points_in_polygon_kernel(points, polygon).tolist(), expected)
+        self.assertEqual(
+            [_point_in_polygon_kernel(x, y, polygon) for x, y in points.tolist()],
+            expected
+        )
+    
+    def test_zone_assignment_by_box_overlap(self):
+        """Test that boxes go to the zone covering most of their area."""
+        triangle = [(0, 0), (100, 0), (0, 100)]
+        self.assertAlmostEqual(
+            polygon_box_overlap(np.array(triangle), {'x': 20, 'y': 20, 'width': 40, 'height': 40}),
+            0.875
+        )
+        
+        monitor = ZoneMonitor([
+            DetectionZone(name="Left", coordinates=[(0, 0), (100, 0), (100, 100), (0, 100)]),
+            DetectionZone(name="Right", coordinates=[(100, 0), (200, 0), (200, 100), (100, 100)])
+        ])
+        zones = monitor.find_zones_by_overlap([
+            {'x': 80, 'y': 10, 'width': 40, 'height': 20},   # 50/50 split: no majority
+            {'x': 70, 'y': 10, 'width': 40, 'height': 20},   # 75% in Left
+            {'x': 90, 'y': 10, 'width': 40, 'height': 20},   # 75% in Right
+            {'x': 300, 'y': 10, 'width': 40, 'height': 20}   # outside every zone
+        ])
+        
+        self.assertEqual([zone.name if zone else None for zone in zones],
+                         [None, "Left", "Right", None])
+
+
+class TestPersonTracker(unittest.TestCase):
+    """Test cases for person tracking across frames."""
+    
+    def test_position_history_ring_buffer(self):
+        """Test that track history keeps the latest positions in order."""
+        tracker = PersonTracker()
+        
+        for frame in range(8):
+            person_id = tracker.track_person(
+                {'x': 10 * frame, 'y': 0, 'width': 20, 'height': 40},
+                frame_number=frame
+            )
+        
+        data = tracker.get_tracking_data(person_id)
+        boxes = data.get_recent_boxes()
+        
+        self.assertEqual(data.history_length, 5)
+        self.assertEqual(boxes[:, 0].tolist(), [30.0, 40.0, 50.0, 60.0, 70.0])
+        self.assertEqual(data.last_position['x'], 70.0)
+        self.assertAlmostEqual(
+            calculate_path_distance(boxes),
+            calculate_path_distance(data.get_recent_positions())
+        )
+        self.assertAlmostEqual(
+            _box_path_length_kernel(boxes),
+            calculate_path_distance(data.get_recent_positions())
+        )
+    
+    def test_track_people_assigns_nearest_track_once(self):
+        """Test that each previous-frame track is claimed by its closest detection."""
+        tracker = PersonTracker()
+        first, second = tracker.track_people([
+            {'x': 0, 'y': 0, 'width': 20, 'height': 40},
+            {'x': 200, 'y': 0, 'width': 20, 'height': 40}
+        ], frame_number=1)
+        
+        # Both new detections are near the first track; only the closer one keeps it
+        ids = tracker.track_people([
+            {'x': 30, 'y': 0, 'width': 20, 'height': 40},
+            {'x': 5, 'y': 0, 'width': 20, 'height': 40},
+            {'x': 190, 'y': 0, 'width': 20, 'height': 40}
+        ], frame_number=2)
+        
+        self.assertEqual(ids[1], first)
+        self.assertEqual(ids[2], second)
+        self.assertNotIn(ids[0], (first, second))
+    
+    def test_tracks_extrapolated_across_skipped_frames(self):
+        """Test that sampled frames match tracks at their extrapolated position."""
+        tracker = PersonTracker(max_frame_gap=30)
+        person_id = tracker.track_person({'x': 0, 'y': 0, 'width': 20, 'height': 40}, 0)
+        tracker.track_person({'x': 60, 'y': 0, 'width': 20, 'height': 40}, 30)
+        
+        # The detection nearer the last position loses to the one where the track is heading
+        nearer, ahead = tracker.track_people([
+            {'x': 20, 'y': 0, 'width': 20, 'height': 40},
+            {'x': 120, 'y': 0, 'width': 20, 'height': 40}
+        ], frame_number=60)
+        
+        self.assertEqual(ahead, person_id)
+        self.assertNotEqual(nearer, person_id)
+        
+        tracked = tracker.get_all_tracked_people()
+        self.assertEqual(set(tracked), {person_id, nearer})
+        with self.assertRaises(TypeError):
+            tracked['person_99'] = tracked[person_id]
+        self.assertEqual(tracker.get_tracking_data(person_id).calculate_dwell_time(60), 2.0)
+        
+        # Beyond the allowed gap a track is no longer continued
+        later = tracker.track_person({'x': 120, 'y': 0, 'width': 20, 'height': 40}, 91)
+        self.assertNotEqual(later, person_id)
+    
+    def test_tracking_data_accepts_position_history(self):
+        """Test that an initial position history seeds the ring buffer."""
+        positions = [{'x': 10.0 * i, 'y': 0.0, 'width': 20.0, 'height': 40.0} for i in range(7)]
+        
+        data = PersonTrackingData(
+            person_id="person_0", first_frame=0, last_frame=6, position_history=positions
+        )
+        
+        self.assertEqual(data.position_history, positions[-5:])
+        self.assertEqual(data.last_frame, 6)
+        self.assertEqual(PersonTrackingData("person_1", 0, 0).position_history, [])
+    
+    def test_cleanup_removes_only_expired_tracks(self):
+        """Test that cleanup evicts stale tracks and keeps recently updated ones."""
+        tracker = PersonTracker(max_frame_gap=1)
+        old_id, kept_id = tracker.track_people([
+            {'x': 0, 'y': 0, 'width': 20, 'height': 40},
+            {'x': 500, 'y': 0, 'width': 20, 'height': 40}
+        ], frame_number=0)
+        
+        # Updating the second track moves it behind the first in eviction order
+        tracker.track_person({'x': 500, 'y': 0, 'width': 20, 'height': 40}, 1)
+        new_id = tracker.track_person({'x': 900, 'y': 0, 'width': 20, 'height': 40}, 250)
+        
+        tracker.cleanup_old_tracks(current_frame=301, max_age_frames=300)
+        
+        self.assertEqual(list(tracker.get_all_tracked_people()), [kept_id, new_id])
+        self.assertIsNone(tracker.get_tracking_data(old_id))
+    
+    @unittest.skipUnless(SCIPY_AVAILABLE, "scipy not installed")
+    def test_kdtree_pairs_match_dense_pairs(self):
+        """Test that the KD-tree search finds the same candidate pairs as the matrix."""
+        rng = np.random.default_rng(7)
+        detections = rng.uniform(0, 1000, size=(40, 2))
+        tracks = rng.uniform(0, 1000, size=(50, 2))
+        
+        dense = PersonTracker._pairs_within_distance(detections, tracks)
+        tree = PersonTracker._pairs_within_distance_kdtree(detections, tracks)
+        
+        self.assertEqual(
+            sorted(zip(dense[0].tolist(), dense[1].tolist())),
+            sorted(zip(tree[0].tolist(), tree[1].tolist()))
+        )
 
 
+class TestBehaviorAnalyzer(unittest.TestCase):
+    """Test cases for BehaviorAnalyzer."""
+    
+    def test_item_matching_is_case_insensitive_substring(self):
+        """Test that item categories match anywhere in the detected name."""
+        analyzer = BehaviorAnalyzer()
+        
+        self.assertTrue(analyzer.analyze_object_for_high_value("Laptop computer", "Exit Door"))
+        self.assertTrue(analyzer.analyze_object_for_high_value("Smartphone", "Main Exit"))
+        self.assertFalse(analyzer.analyze_object_for_high_value("Laptop", "Aisle 3"))
+        self.assertFalse(analyzer.analyze_object_for_high_value("Banana", "Exit"))
+        self.assertTrue(analyzer.is_high_value_at_exit("Laptop", DetectionZone(
+            name="Main_Exit", coordinates=[(0, 0), (10, 0), (10, 10)]
+        ).is_exit))
+        self.assertTrue(analyzer.is_concealment_item("Handbag"))
+        self.assertFalse(analyzer.is_concealment_item("Bottle"))
+        
+        # Repeated names are answered from the per-name cache
+        self.assertEqual(analyzer._item_flags["Handbag"], (False, True))
+    
+    def test_person_movement_result(self):
+        """Test movement analysis for short and sufficient track histories."""
+        analyzer = BehaviorAnalyzer()
+        tracker = PersonTracker()
+        
+        person_id = tracker.track_person({'x': 0, 'y': 0, 'width': 20, 'height': 40}, 1)
+        self.assertEqual(
+            analyzer.analyze_person_movement(tracker.get_tracking_data(person_id), 1),
+            (False, 0.0, 0)
+        )
+        
+        tracker.track_person({'x': 30, 'y': 40, 'width': 20, 'height': 40}, 2)
+        result = analyzer.analyze_person_movement(tracker.get_tracking_data(person_id), 2)
+        
+        self.assertEqual(result.frames_tracked, 2)
+        self.assertAlmostEqual(result.speed, 50 / (2 / 30))
+    
+    def test_concealment_patterns_match_whole_tags(self):
+        """Test that pattern tags must appear as whole scene tags."""
+        analyzer = BehaviorAnalyzer()
+        
+        self.assertEqual(
+            analyzer.detect_concealment_patterns(['Person', 'indoor', 'Reaching']),
+            "Person reaching for items"
+        )
+        # Substrings of other tags no longer count as matches
+        self.assertIsNone(
+            analyzer.detect_concealment_patterns(['person', 'handbag', 'clothing store'])
+        )
+
 class TestTheftAlert(unittest.TestCase):
     """Test cases for TheftAlert data class."""
     
@@ -104,11 +394,154 @@ class TestTheftAlert(unittest.TestCase):
         self.assertEqual(alert.location, "Test_Zone")
         self.assertEqual(alert.severity, "MEDIUM")
         self.assertEqual(len(alert.bounding_boxes), 1)
+        self.assertEqual(alert.to_dict()['timestamp'], alert.timestamp.isoformat())
+        
+        # Reassigning the timestamp refreshes the cached ISO string
+        alert.timestamp = datetime(2024, 1, 15, 14, 30)
+        self.assertEqual(alert.to_dict()['timestamp'], "2024-01-15T14:30:00")
+        self.assertNotIn('_timestamp_iso', alert.to_dict())
+    
+    def test_alert_rejects_invalid_fields(self):
+        """Test that invalid severity or confidence values are rejected."""
+        fields = dict(
+            timestamp=datetime.now(),
+            alert_type="TEST_ALERT",
+            location="Test_Zone",
+            description="Test alert description",
+            image_path="/path/to/image.jpg",
+            bounding_boxes=[]
+        )
+        
+        with self.assertRaisesRegex(ValidationError, "severity"):
+            TheftAlert(confidence=0.5, severity="URGENT", **fields)
+        with self.assertRaisesRegex(ValidationError, "severity"):
+            TheftAlert(confidence=0.5, severity=["HIGH"], **fields)
+        with self.assertRaisesRegex(ValidationError, "Confidence"):
+            TheftAlert(confidence=1.5, severity="HIGH", **fields)
+    
+    def test_recent_alerts_are_bounded(self):
+        """Test that only the newest MAX_RECENT_ALERTS alerts are kept."""
+        manager = AlertManager(quiet=True)
+        
+        with patch('builtins.print') as mock_print:
+            for i in range(105):
+                manager.create_alert(
+                    alert_type="LOITERING",
+                    confidence=0.85,
+                    location="Entrance",
+                    description=f"Alert {i}",
+                    image_path=f"frame_{i}",
+                    bounding_boxes=[]
+                )
+        
+        mock_print.assert_not_called()
+        
+        self.assertEqual(manager.get_alert_count(), 100)
+        self.assertEqual(manager.get_recent_alerts()[0].description, "Alert 5")
+        self.assertEqual(
+            [alert.description for alert in manager.get_recent_alerts(2)],
+            ["Alert 103", "Alert 104"]
+        )
+    
+    def test_alert_tallies_follow_evictions(self):
+        """Test that by-type and by-severity counts only cover stored alerts."""
+        manager = AlertManager()
+        
+        with patch('builtins.print'):
+            for i in range(150):
+                manager.create_alert(
+                    alert_type="LOITERING" if i < 60 else "RESTRICTED_AREA_VIOLATION",
+                    confidence=0.85,
+                    location="Entrance",
+                    description=f"Alert {i}",
+                    image_path=f"frame_{i}",
+                    bounding_boxes=[],
+                    severity="MEDIUM" if i < 60 else "CRITICAL"
+                )
+        
+        # Alerts 50-149 remain: ten loitering, ninety restricted
+        report = manager._build_report()
+        self.assertEqual(report['by_type'], {'LOITERING': 10, 'RESTRICTED_AREA_VIOLATION': 90})
+        self.assertEqual(report['by_severity'], {'MEDIUM': 10, 'CRITICAL': 90})
+        
+        manager.clear_alerts()
+        self.assertEqual(manager._build_report()['by_type'], {})
+    
+    def test_report_file_matches_returned_report(self):
+        """Test that the saved report is valid JSON equal to the returned dict."""
+        manager = AlertManager()
+        manager.create_alert(
+            alert_type="LOITERING",
+            confidence=0.85,
+            location="Entrance",
+            description="Person loitering",
+            image_path="frame_0",
+            bounding_boxes=[{'x': 10, 'y': 20, 'width': 100, 'height': 200}]
+        )
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            report_path = os.path.join(test_dir, "report.json")
+            report = manager.generate_report(report_path)
+            
+            with open(report_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), report)
+            
+            report = manager.generate_report(report_path, pretty=False)
+            with open(report_path, encoding='utf-8') as f:
+                compact = f.read()
+            self.assertEqual(json.loads(compact), report)
+            self.assertNotIn('\n', compact)
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+    
+    def test_jsonl_sink_records_each_alert(self):
+        """Test that every created alert is appended to the JSON Lines sink once."""
+        manager = AlertManager(quiet=True)
+        test_dir = tempfile.mkdtemp()
+        try:
+            sink_path = os.path.join(test_dir, "alerts.jsonl")
+            manager.enable_jsonl_sink(sink_path)
+            for i in range(3):
+                manager.create_alert(
+                    alert_type="LOITERING",
+                    confidence=0.85,
+                    location="Entrance",
+                    description=f"Person loitering {i}",
+                    image_path=f"frame_{i}",
+                    bounding_boxes=[]
+                )
+            manager.close_jsonl_sink()
+            
+            # Alerts created after closing are not written
+            manager.create_alert("LOITERING", 0.85, "Entrance", "Late", "frame_3", [])
+            
+            with open(sink_path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(
+                lines,
+                [alert.to_dict() for alert in manager.get_recent_alerts(4)[:3]]
+            )
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
 
 
 class TestRetailTheftDetector(unittest.TestCase):
     """Test cases for the main RetailTheftDetector class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Patch the Azure client and build one shared detector."""
+        patcher = patch('vision_analyzer.ImageAnalysisClient')
+        cls.mock_client_class = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        
+        # Helper tests only read the detector, so one instance is enough
+        cls.detector = RetailTheftDetector(
+            endpoint="https://test.cognitiveservices.azure.com/",
+            key="0123456789abcdef0123456789abcdef"
+        )
+    
     def setUp(self):
         """Set up test fixtures before each test."""
         # Create a temporary directory for test outputs
@@ -118,20 +551,17 @@ class TestRetailTheftDetector(unittest.TestCase):
         self.mock_endpoint = "https://test.cognitiveservices.azure.com/"
         self.mock_key = "0123456789abcdef0123456789abcdef"
         
-        # Create mock Vision client
-        self.mock_vision_client = MagicMock()
+        # Reset the shared client mock instead of re-patching per test
+        self.mock_client_class.reset_mock()
+        self.mock_vision_client = self.mock_client_class.return_value
         
-        # Patch the ImageAnalysisClient to return our mock
-        self.patcher = patch('retail_theft_detection.ImageAnalysisClient')
-        self.mock_client_class = self.patcher.start()
-        self.mock_client_class.return_value = self.mock_vision_client
+        # Drop state left on the shared detector by the previous test
+        self.detector._alert_manager.clear_alerts()
+        self.detector._orchestrator._person_tracker = PersonTracker()
     
     
     def tearDown(self):
         """Clean up after each test."""
-        # Stop the patcher
-        self.patcher.stop()
-        
         # Remove temporary directory
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
@@ -157,31 +587,29 @@ class TestRetailTheftDetector(unittest.TestCase):
     
     def test_point_in_polygon(self):
         """Test point-in-polygon detection."""
-        detector = RetailTheftDetector(
-            endpoint=self.mock_endpoint,
-            key=self.mock_key
-        )
+        detector = self.detector
         
         # Define a square polygon
         polygon = [(0, 0), (100, 0), (100, 100), (0, 100)]
         
-        # Test points inside
-        self.assertTrue(detector._point_in_polygon((50, 50), polygon))
-        self.assertTrue(detector._point_in_polygon((10, 10), polygon))
-        self.assertTrue(detector._point_in_polygon((90, 90), polygon))
+        # Points inside, then points outside
+        cases = [
+            ((50, 50), True),
+            ((10, 10), True),
+            ((90, 90), True),
+            ((150, 50), False),
+            ((50, 150), False),
+            ((-10, 50), False),
+        ]
         
-        # Test points outside
-        self.assertFalse(detector._point_in_polygon((150, 50), polygon))
-        self.assertFalse(detector._point_in_polygon((50, 150), polygon))
-        self.assertFalse(detector._point_in_polygon((-10, 50), polygon))
+        for point, expected in cases:
+            with self.subTest(point=point):
+                self.assertEqual(detector._point_in_polygon(point, polygon), expected)
     
     
     def test_get_zone_for_location(self):
         """Test finding zone for a given location."""
-        detector = RetailTheftDetector(
-            endpoint=self.mock_endpoint,
-            key=self.mock_key
-        )
+        detector = self.detector
         
         # Add a test zone
         test_zone = DetectionZone(
@@ -202,10 +630,7 @@ class TestRetailTheftDetector(unittest.TestCase):
     
     def test_calculate_distance(self):
         """Test bounding box distance calculation."""
-        detector = RetailTheftDetector(
-            endpoint=self.mock_endpoint,
-            key=self.mock_key
-        )
+        detector = self.detector
         
         loc1 = {'x': 0, 'y': 0, 'width': 10, 'height': 10}
         loc2 = {'x': 30, 'y': 40, 'width': 10, 'height': 10}
@@ -217,10 +642,7 @@ class TestRetailTheftDetector(unittest.TestCase):
     
     def test_track_person(self):
         """Test person tracking across frames."""
-        detector = RetailTheftDetector(
-            endpoint=self.mock_endpoint,
-            key=self.mock_key
-        )
+        detector = self.detector
         
         # First detection
         location1 = {'x': 100, 'y': 100, 'width': 50, 'height': 100}
@@ -246,10 +668,7 @@ class TestRetailTheftDetector(unittest.TestCase):
     
     def test_calculate_dwell_time(self):
         """Test dwell time calculation."""
-        detector = RetailTheftDetector(
-            endpoint=self.mock_endpoint,
-            key=self.mock_key
-        )
+        detector = self.detector
         
         # Track a person for multiple frames
         person_id = "person_0"
@@ -264,38 +683,32 @@ class TestRetailTheftDetector(unittest.TestCase):
         self.assertAlmostEqual(dwell_time, 3.0, places=1)
     
     
-    @patch('retail_theft_detection.open', create=True)
-    @patch('os.path.exists')
-    def test_analyze_frame_with_mocked_api(self, mock_exists, mock_open):
+    def test_analyze_frame_with_mocked_api(self):
         """Test frame analysis with mocked Azure API response."""
-        # Mock file existence check
-        mock_exists.return_value = True
-        
         detector = RetailTheftDetector(
             endpoint=self.mock_endpoint,
             key=self.mock_key
         )
         
-        # Create mock image data
-        mock_file = MagicMock()
-        mock_file.read.return_value = b'fake_image_data'
-        mock_open.return_value.__enter__.return_value = mock_file
-        
         # Create mock Azure API response
-        mock_person = MagicMock()
-        mock_person.bounding_box = MagicMock(x=100, y=100, width=50, height=100)
-        mock_person.confidence = 0.95
+        mock_person = SimpleNamespace(
+            bounding_box=SimpleNamespace(x=100, y=100, width=50, height=100),
+            confidence=0.95
+        )
         
-        mock_result = MagicMock()
-        mock_result.people = MagicMock(list=[mock_person])
-        mock_result.objects = MagicMock(list=[])
-        mock_result.tags = MagicMock(list=[])
-        mock_result.caption = MagicMock(text="A person in a store")
+        mock_result = SimpleNamespace(
+            people=SimpleNamespace(list=[mock_person]),
+            objects=SimpleNamespace(list=[]),
+            tags=SimpleNamespace(list=[]),
+            caption=SimpleNamespace(text="A person in a store")
+        )
         
         self.mock_vision_client.analyze.return_value = mock_result
         
-        # Analyze frame
-        alerts = detector.analyze_frame("test_image.jpg", frame_number=1)
+        # Analyze in-memory image data so no file is touched
+        alerts = detector.analyze_frame(
+            "test_image.jpg", frame_number=1, image_bytes=b'fake_image_data'
+        )
         
         # Verify API was called
         self.mock_vision_client.analyze.assert_called_once()
@@ -312,18 +725,18 @@ class TestRetailTheftDetector(unittest.TestCase):
         )
         
         # Create mock object detection results
-        mock_tag = MagicMock()
-        mock_tag.name = "laptop"
-        mock_tag.confidence = 0.9
+        mock_tag = SimpleNamespace(name="laptop", confidence=0.9)
         
-        mock_object = MagicMock()
-        mock_object.tags = [mock_tag]
-        mock_object.bounding_box = MagicMock(x=700, y=100, width=100, height=50)
+        mock_object = SimpleNamespace(
+            tags=[mock_tag],
+            bounding_box=SimpleNamespace(x=700, y=100, width=100, height=50)
+        )
         
-        mock_result = MagicMock()
-        mock_result.objects = MagicMock(list=[mock_object])
-        mock_result.people = None
-        mock_result.tags = None
+        mock_result = SimpleNamespace(
+            objects=SimpleNamespace(list=[mock_object]),
+            people=None,
+            tags=None
+        )
         
         # Test with exit zone
         detector.zones = [
@@ -344,39 +757,35 @@ class TestRetailTheftDetector(unittest.TestCase):
 class TestLoggingInstrumentation(unittest.TestCase):
     """Test cases for logging and instrumentation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one logger for tests that do not check file output."""
+        cls.shared_log_dir = tempfile.mkdtemp()
+        cls.shared_logger = TheftDetectionLogger(
+            name="SharedTestLogger",
+            log_dir=cls.shared_log_dir,
+            enable_console=False,
+            enable_file=False
+        )
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared logger and remove its log directory."""
+        cls.shared_logger.close()
+        shutil.rmtree(cls.shared_log_dir, ignore_errors=True)
+    
     def setUp(self):
         """Set up test fixtures."""
         self.test_log_dir = tempfile.mkdtemp()
-    
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        # Close all logging handlers to release file locks
-        logging.shutdown()
-        
-        # Small delay to ensure file handles are released on Windows
-        time.sleep(0.1)
-        
-        if os.path.exists(self.test_log_dir):
-            try:
-                shutil.rmtree(self.test_log_dir)
-            except PermissionError:
-                # On Windows, files might still be locked, try again after a short wait
-                time.sleep(0.5)
-                shutil.rmtree(self.test_log_dir)
+        self.addCleanup(shutil.rmtree, self.test_log_dir, ignore_errors=True)
     
     
     def test_logger_initialization(self):
         """Test logger initialization."""
-        logger = TheftDetectionLogger(
-            name="TestLogger",
-            log_dir=self.test_log_dir,
-            enable_console=False,
-            enable_file=True
-        )
+        logger = self.shared_logger
         
         # Verify log directory was created
-        self.assertTrue(os.path.exists(self.test_log_dir))
+        self.assertTrue(os.path.exists(self.shared_log_dir))
         
         # Verify logger was created
         self.assertIsNotNone(logger.logger)
@@ -384,33 +793,27 @@ class TestLoggingInstrumentation(unittest.TestCase):
     
     def test_logging_levels(self):
         """Test different logging levels."""
-        logger = TheftDetectionLogger(
-            name="TestLogger",
-            log_dir=self.test_log_dir,
-            enable_console=False,
-            enable_file=True
+        logger = self.shared_logger
+        
+        # Test all logging levels, capturing records in memory
+        with self.assertLogs(logger.logger, level=logging.INFO) as captured:
+            logger.debug("Debug message")
+            logger.info("Info message")
+            logger.warning("Warning message")
+            logger.error("Error message")
+            logger.critical("Critical message")
+        
+        # Debug is below the logger's default INFO level
+        self.assertEqual(
+            [record.levelname for record in captured.records],
+            ['INFO', 'WARNING', 'ERROR', 'CRITICAL']
         )
-        
-        # Test all logging levels
-        logger.debug("Debug message")
-        logger.info("Info message")
-        logger.warning("Warning message")
-        logger.error("Error message")
-        logger.critical("Critical message")
-        
-        # Verify log file was created
-        log_files = os.listdir(self.test_log_dir)
-        self.assertGreater(len(log_files), 0)
+        self.assertEqual(captured.records[0].getMessage(), "Info message")
     
     
     def test_performance_monitor(self):
         """Test performance monitoring."""
-        logger = TheftDetectionLogger(
-            name="TestLogger",
-            log_dir=self.test_log_dir,
-            enable_console=False,
-            enable_file=True
-        )
+        logger = self.shared_logger
         
         monitor = PerformanceMonitor(logger)
         
@@ -436,38 +839,162 @@ class TestLoggingInstrumentation(unittest.TestCase):
     
     def test_metrics_export(self):
         """Test metrics export to JSON."""
-        logger = TheftDetectionLogger(
-            name="TestLogger",
-            log_dir=self.test_log_dir,
-            enable_console=False,
-            enable_file=True
-        )
+        logger = self.shared_logger
         
         monitor = PerformanceMonitor(logger)
         monitor.record_api_call("test", 100.0, success=True)
+        monitor.record_alert("CONCEALMENT", "HIGH")
         
-        # Export metrics
-        output_file = os.path.join(self.test_log_dir, "metrics.json")
-        monitor.export_metrics(output_file)
-        
-        # Verify file was created
-        self.assertTrue(os.path.exists(output_file))
+        # Export metrics to an in-memory stream
+        buffer = io.StringIO()
+        monitor.export_metrics(buffer)
         
         # Verify JSON content
+        data = json.loads(buffer.getvalue())
+        
+        # Exporting to a path writes the same metrics
+        output_file = os.path.join(self.test_log_dir, "metrics.json")
+        monitor.export_metrics(output_file)
         with open(output_file, 'r') as f:
-            data = json.load(f)
+            self.assertEqual(json.load(f)['metrics'], data['metrics'])
         
         self.assertIn('timestamp', data)
         self.assertIn('statistics', data)
         self.assertIn('metrics', data)
+        self.assertEqual(data['metrics']['alerts'][0]['alert_type'], "CONCEALMENT")
+    
+    
+    def test_metric_ring_buffer_keeps_latest_samples(self):
+        """Test that the metric ring buffer overwrites its oldest samples."""
+        buffer = MetricRingBuffer([('frame', np.int64), ('duration_ms', np.float64)], capacity=3)
+        
+        for frame in range(5):
+            buffer.append(frame, frame * 10.0)
+        
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(sorted(buffer.values('duration_ms').tolist()), [20.0, 30.0, 40.0])
+        self.assertEqual(
+            [record['frame'] for record in buffer.to_records()],
+            [2, 3, 4]
+        )
+    
+    
+    def test_metric_ring_buffer_summary_tracks_window(self):
+        """Test that running aggregates follow samples out of the window."""
+        buffer = MetricRingBuffer([('duration_ms', np.float64)], capacity=3, tracked=('duration_ms',))
+        
+        for duration in [50.0, 10.0, 20.0, 30.0, 40.0]:
+            buffer.append(duration)
+            window = buffer.values('duration_ms')
+            mean_ms, min_ms, max_ms = buffer.summary('duration_ms')
+            self.assertAlmostEqual(mean_ms, float(window.mean()))
+            self.assertEqual(min_ms, float(window.min()))
+            self.assertEqual(max_ms, float(window.max()))
+        
+        self.assertEqual(buffer.summary('duration_ms'), (30.0, 20.0, 40.0))
+    
+    
+    def test_retry_on_error_retries_until_success(self):
+        """Test that a failing call is retried with backoff and then succeeds."""
+        logger = _closing_logger(
+            self,
+            name="TestLogger",
+            log_dir=self.test_log_dir,
+            enable_console=False,
+            enable_file=False
+        )
+        calls = []
+        
+        @retry_on_error(logger, max_retries=2, delay_seconds=0.001)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("transient")
+            return "ok"
+        
+        self.assertEqual(flaky(), "ok")
+        self.assertEqual(len(calls), 3)
+    
+    
+    def test_records_written_by_background_listener(self):
+        """Test that queued records reach the log file once the logger is closed."""
+        logger = _closing_logger(
+            self,
+            name="TestLogger",
+            log_dir=self.test_log_dir,
+            enable_console=False,
+            enable_file=True
+        )
+        
+        # Only the queue handler is attached to the logger itself
+        self.assertEqual(len(logger.logger.handlers), 1)
+        self.assertIsInstance(logger.logger.handlers[0], logging.handlers.QueueHandler)
+        
+        logger.warning("Queued message", zone="Exit_Zone")
+        logger.close()
+        
+        with open(os.path.join(self.test_log_dir, 'theft_detection.log'), encoding='utf-8') as f:
+            contents = f.read()
+        
+        self.assertIn("Queued message", contents)
+        self.assertIn("Exit_Zone", contents)
+    
+    
+    def test_json_log_lines_are_valid_json(self):
+        """Test that the structured log escapes quotes and newlines."""
+        logger = _closing_logger(
+            self,
+            name="TestLogger",
+            log_dir=self.test_log_dir,
+            enable_console=False,
+            enable_file=True
+        )
+        
+        logger.info('Person "7" left\nthrough exit', person_id=7)
+        logger.close()
+        
+        with open(os.path.join(self.test_log_dir, 'theft_detection_json.log'), encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        
+        entry = entries[-1]
+        self.assertEqual(entry['message'], 'Person "7" left\nthrough exit')
+        self.assertEqual(entry['context'], {'person_id': 7})
+        datetime.strptime(entry['timestamp'], '%Y-%m-%d %H:%M:%S,%f')
+        self.assertEqual(entry['function'], 'test_json_log_lines_are_valid_json')
+    
+    def test_json_log_accepts_int_keyed_context(self):
+        """Test that context dicts with non-string keys are logged."""
+        logger = _closing_logger(
+            self,
+            name="TestLogger",
+            log_dir=self.test_log_dir,
+            enable_console=False,
+            enable_file=True
+        )
+        
+        logger.info("Dwell times", dwell={7: 12.5, 9: 3.0})
+        logger.close()
+        
+        with open(os.path.join(self.test_log_dir, 'theft_detection_json.log'), encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        
+        self.assertEqual(entries[-1]['context'], {'dwell': {'7': 12.5, '9': 3.0}})
 
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete system."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Patch the Azure client once for the whole class."""
+        patcher = patch('vision_analyzer.ImageAnalysisClient')
+        cls.mock_client_class = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+    
     def setUp(self):
         """Set up integration test fixtures."""
         self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
         self.mock_endpoint = "https://test.cognitiveservices.azure.com/"
         self.mock_key = "0123456789abcdef0123456789abcdef"
         
@@ -475,43 +1002,23 @@ class TestIntegration(unittest.TestCase):
         self.test_image_path = os.path.join(self.test_dir, "test_frame.jpg")
         self._create_test_image(self.test_image_path)
         
-        # Patch Azure client
-        self.patcher = patch('retail_theft_detection.ImageAnalysisClient')
-        self.mock_client_class = self.patcher.start()
-        self.mock_vision_client = MagicMock()
-        self.mock_client_class.return_value = self.mock_vision_client
-    
-    
-    def tearDown(self):
-        """Clean up after integration tests."""
-        self.patcher.stop()
-        
-        # Close all logging handlers to release file locks
-        logging.shutdown()
-        
-        # Small delay to ensure file handles are released on Windows
-        time.sleep(0.1)
-        
-        if os.path.exists(self.test_dir):
-            try:
-                shutil.rmtree(self.test_dir)
-            except PermissionError:
-                # On Windows, files might still be locked, try again after a short wait
-                time.sleep(0.5)
-                shutil.rmtree(self.test_dir)
+        # Reset the shared Azure client mock
+        self.mock_client_class.reset_mock()
+        self.mock_vision_client = self.mock_client_class.return_value
     
     
     def _create_test_image(self, path: str):
         """Create a test image file."""
-        # Create a simple 640x480 black image
-        img = np.zeros((480, 640, 3), dtype=np.uint8)
+        # The Azure client is mocked, so a tiny black image is enough
+        img = np.zeros((16, 16, 3), dtype=np.uint8)
         cv2.imwrite(path, img)
     
     
     def test_end_to_end_detection(self):
         """Test complete detection workflow."""
         # Initialize detector with logging
-        logger = TheftDetectionLogger(
+        logger = _closing_logger(
+            self,
             name="IntegrationTest",
             log_dir=self.test_dir,
             enable_console=False,
@@ -524,17 +1031,7 @@ class TestIntegration(unittest.TestCase):
         )
         
         # Mock Azure API response with person in restricted area
-        mock_person = MagicMock()
-        mock_person.bounding_box = MagicMock(x=50, y=450, width=50, height=100)
-        mock_person.confidence = 0.95
-        
-        mock_result = MagicMock()
-        mock_result.people = MagicMock(list=[mock_person])
-        mock_result.objects = MagicMock(list=[])
-        mock_result.tags = MagicMock(list=[])
-        mock_result.caption = MagicMock(text="Person in store")
-        
-        self.mock_vision_client.analyze.return_value = mock_result
+        self.mock_vision_client.analyze.return_value = PERSON_IN_RESTRICTED_AREA_RESULT
         
         # Set up zone that matches the person location
         detector.zones = [
@@ -563,25 +1060,433 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(os.path.exists(report_path))
 
 
-class TestDemoMode(unittest.TestCase):
-    """Test cases for demo mode functionality."""
+class StubVisionAnalyzer:
+    """Vision analyzer stand-in returning one person in the restricted zone."""
+    
+    def __init__(self):
+        """Initialize the call counter."""
+        self.calls = 0
+        self.last_image = None
+    
+    def analyze_image_bytes(self, image_data: bytes):
+        """Return a canned analysis result."""
+        self.calls += 1
+        self.last_image = image_data
+        return PERSON_IN_RESTRICTED_AREA_RESULT
+    
+    def analyze_image(self, image_path: str):
+        """Return the canned result, failing for paths containing 'missing'."""
+        if "missing" in image_path:
+            raise FileNotFoundError(image_path)
+        return self.analyze_image_bytes(b"")
+
+
+class TestVisionAnalyzer(unittest.TestCase):
+    """Test cases for the Azure AI Vision wrapper."""
     
     def setUp(self):
-        """Set up test fixtures."""
+        """Create a cache directory."""
         self.test_dir = tempfile.mkdtemp()
     
     def tearDown(self):
         """Clean up after tests."""
-        # Close all logging handlers
-        logging.shutdown()
-        time.sleep(0.1)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def _create_analyzer(self) -> VisionAnalyzer:
+        """Create an analyzer whose client returns one detected person."""
+        analyzer = VisionAnalyzer(
+            "https://test.cognitiveservices.azure.com/", "a" * 32, cache_dir=self.test_dir
+        )
+        analyzer._client = MagicMock()
+        analyzer._client.analyze.return_value = ImageAnalysisResult({
+            "modelVersion": "2023-10-01",
+            "metadata": {"width": 64, "height": 48},
+            "peopleResult": {"values": [
+                {"boundingBox": {"x": 1, "y": 2, "w": 3, "h": 4}, "confidence": 0.9}
+            ]}
+        })
+        return analyzer
+    
+    def test_identical_images_reuse_cached_result(self):
+        """Test that repeated image bytes are answered from memory and from disk."""
+        analyzer = self._create_analyzer()
         
-        if os.path.exists(self.test_dir):
-            try:
-                shutil.rmtree(self.test_dir)
-            except PermissionError:
-                time.sleep(0.5)
-                shutil.rmtree(self.test_dir)
+        first = analyzer.analyze_image_bytes(b"frame-1")
+        again = analyzer.analyze_image_bytes(b"frame-1")
+        analyzer.analyze_image_bytes(b"frame-2")
+        
+        self.assertIs(again, first)
+        self.assertEqual(analyzer._client.analyze.call_count, 2)
+        
+        # A fresh analyzer sharing the cache directory skips the API call
+        restarted = self._create_analyzer()
+        result = restarted.analyze_image_bytes(b"frame-1")
+        
+        restarted._client.analyze.assert_not_called()
+        self.assertEqual(result.people.list[0].bounding_box.height, 4)
+        
+        # The configured features are resolved to SDK enums once
+        self.assertEqual(
+            analyzer._client.analyze.call_args.kwargs['visual_features'],
+            [VisualFeatures.PEOPLE, VisualFeatures.OBJECTS, VisualFeatures.TAGS, VisualFeatures.CAPTION]
+        )
+    
+    def test_missing_image_raises_validation_error(self):
+        """Test that a missing file is reported without calling Azure."""
+        analyzer = self._create_analyzer()
+        
+        with self.assertRaises(ValidationError):
+            analyzer.analyze_image(os.path.join(self.test_dir, "missing.jpg"))
+        analyzer._client.analyze.assert_not_called()
+
+
+class TestDetectionOrchestrator(unittest.TestCase):
+    """Test cases for multi-frame orchestration."""
+    
+    def test_analyze_frames_keeps_input_order(self):
+        """Test that concurrent fetches are processed in frame order."""
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager()
+        )
+        
+        results = orchestrator.analyze_frames(
+            ["frame_a.jpg", "frame_b.jpg", "missing.jpg", "frame_c.jpg"], max_workers=4
+        )
+        
+        self.assertEqual(analyzer.calls, 3)
+        self.assertEqual([len(alerts) for alerts in results], [1, 1, 0, 1])
+        self.assertEqual(results[1][0].image_path, "frame_b.jpg")
+        self.assertEqual(results[3][0].image_path, "frame_c.jpg")
+        # The failed frame 2 is bridged, so the person keeps one track
+        self.assertEqual(len(orchestrator.person_tracker.get_all_tracked_people()), 1)
+    
+    def test_empty_scene_skips_detection_stages(self):
+        """Test that a result without detections returns early and still ages tracks."""
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=StubVisionAnalyzer(),
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        orchestrator.person_tracker.track_person({'x': 0, 'y': 0, 'width': 20, 'height': 40}, 0)
+        
+        empty_result = SimpleNamespace(
+            people=SimpleNamespace(list=[]),
+            objects=None,
+            tags=SimpleNamespace(list=[])
+        )
+        
+        with patch.object(orchestrator, '_analyze_people') as analyze_people:
+            alerts = orchestrator.process_analysis_result(empty_result, "frame_400", 400)
+        
+        self.assertEqual(alerts, [])
+        analyze_people.assert_not_called()
+        self.assertEqual(len(orchestrator.person_tracker.get_all_tracked_people()), 0)
+    
+    def test_tracks_evicted_after_configured_age(self):
+        """Test that tracks outlive a frame gap and expire at the configured age."""
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=StubVisionAnalyzer(),
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        tracker = orchestrator.person_tracker
+        tracker.track_person({'x': 0, 'y': 0, 'width': 20, 'height': 40}, 0)
+        empty_result = SimpleNamespace(
+            people=SimpleNamespace(list=[]),
+            objects=None,
+            tags=SimpleNamespace(list=[])
+        )
+        max_age = TrackingConfig.TRACK_MAX_AGE_FRAMES
+        
+        self.assertGreater(max_age, TrackingConfig.MAX_TRACK_GAP_FRAMES)
+        orchestrator.process_analysis_result(empty_result, "frame", max_age)
+        self.assertEqual(len(tracker.get_all_tracked_people()), 1)
+        orchestrator.process_analysis_result(empty_result, "frame", max_age + 1)
+        self.assertEqual(len(tracker.get_all_tracked_people()), 0)
+    
+    def test_quiet_orchestrator_prints_only_errors(self):
+        """Test that quiet mode suppresses per-frame progress but not errors."""
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=StubVisionAnalyzer(),
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = orchestrator.analyze_frames(["frame_a.jpg", "missing.jpg"])
+        
+        self.assertEqual([len(alerts) for alerts in results], [1, 0])
+        self.assertEqual(output.getvalue(), "✗ Error during analysis: missing.jpg\n")
+
+
+class TestVideoProcessor(unittest.TestCase):
+    """Test cases for the video processing pipeline."""
+    
+    def setUp(self):
+        """Set up a short synthetic video."""
+        self.test_dir = tempfile.mkdtemp()
+        self.video_path = os.path.join(self.test_dir, "clip.avi")
+        
+        writer = cv2.VideoWriter(
+            self.video_path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (64, 48)
+        )
+        for i in range(61):
+            # A bar moving across the frame keeps every sample distinct
+            frame = np.zeros((48, 64, 3), dtype=np.uint8)
+            frame[:, i % 56:i % 56 + 8] = 255
+            writer.write(frame)
+        writer.release()
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_sampled_frames_analyzed_and_alerts_saved(self):
+        """Test that every sampled frame is analyzed and its alerts are saved."""
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager()
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        
+        processor.process(self.video_path)
+        
+        # Frames 0, 30 and 60 are sampled at the default skip interval
+        self.assertEqual(analyzer.calls, 3)
+        alert_images = sorted(f for f in os.listdir(self.test_dir) if f.startswith("alert_"))
+        self.assertEqual(alert_images, [
+            "alert_RESTRICTED_AREA_VIOLATION_0.jpg",
+            "alert_RESTRICTED_AREA_VIOLATION_30.jpg",
+            "alert_RESTRICTED_AREA_VIOLATION_60.jpg"
+        ])
+    
+    def test_cached_banner_matches_put_text(self):
+        """Test that the cached alert headline looks like a direct cv2.putText."""
+        processor = VideoProcessor(orchestrator=None, output_dir=self.test_dir)
+        text = "RESTRICTED_AREA_VIOLATION - CRITICAL"
+        frame = np.random.default_rng(3).integers(0, 256, (120, 640, 3), dtype=np.uint8)
+        
+        expected = frame.copy()
+        cv2.putText(expected, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        for _ in range(2):
+            actual = frame.copy()
+            processor._blend_banner(actual, text, (0, 0, 255))
+            # Blending anti-aliased coverage may round differently by one level
+            self.assertLessEqual(np.abs(actual.astype(int) - expected.astype(int)).max(), 1)
+        
+        self.assertEqual(list(processor._banner_cache), [text])
+    
+    def test_alert_boxes_drawn_like_rectangles(self):
+        """Test that batched box outlines match per-box cv2.rectangle calls."""
+        processor = VideoProcessor(orchestrator=None, output_dir=self.test_dir)
+        boxes = [
+            {'x': 10, 'y': 40, 'width': 50, 'height': 60},
+            {'x': 600, 'y': 400, 'width': 100, 'height': 100}
+        ]
+        alert = TheftAlert(
+            timestamp=datetime(2024, 1, 15, 14, 30, 0),
+            alert_type="LOITERING",
+            confidence=0.85,
+            location="Entrance",
+            description="Person loitering",
+            image_path="frame_0",
+            bounding_boxes=boxes,
+            severity="MEDIUM"
+        )
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        
+        expected = processor._annotate_frame(frame, alert).copy()
+        self.assertFalse(frame.any())
+        for bbox in boxes:
+            x, y, w, h = bbox['x'], bbox['y'], bbox['width'], bbox['height']
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 0, 255), 2)
+        processor._blend_banner(frame, "LOITERING - MEDIUM", (0, 0, 255))
+        cv2.putText(frame, "2024-01-15 14:30:00", (10, 70),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        
+        self.assertTrue(np.array_equal(expected, frame))
+        
+        # The annotation canvas is reused rather than reallocated per alert
+        canvas = processor._scratch
+        self.assertIs(processor._annotate_frame(frame, alert), canvas)
+    
+    def test_large_frames_downscaled_before_upload(self):
+        """Test that oversized frames are shrunk and detections scaled back up."""
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        
+        result, scale = processor._request_analysis(np.zeros((1440, 2560, 3), np.uint8), 0)
+        uploaded = cv2.imdecode(np.frombuffer(analyzer.last_image, np.uint8), cv2.IMREAD_COLOR)
+        
+        self.assertEqual(uploaded.shape[:2], (720, 1280))
+        self.assertEqual(scale, 2.0)
+        self.assertEqual(
+            orchestrator._create_bounding_box_dict(result.people.list[0].bounding_box, scale),
+            {'x': 100, 'y': 900, 'width': 100, 'height': 200}
+        )
+        
+        # Frames within the limit are sent unchanged
+        _, scale = processor._request_analysis(np.zeros((48, 64, 3), np.uint8), 1)
+        self.assertEqual(scale, 1.0)
+    
+    def test_adaptive_frame_skip_follows_alerts(self):
+        """Test that the sampling interval shrinks on alerts and recovers when quiet."""
+        processor = VideoProcessor(orchestrator=None, output_dir=self.test_dir)
+        
+        intervals = []
+        for alerts in [1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]:
+            processor._adapt_frame_skip(alerts)
+            intervals.append(processor._current_skip)
+        
+        self.assertEqual(intervals, [15, 7, 5, 5, 6, 7, 8, 10, 12, 15, 18, 22, 27])
+        for _ in range(5):
+            processor._adapt_frame_skip(0)
+        self.assertEqual(processor._current_skip, 30)
+    
+    def test_batch_size_bounds_requests_in_flight(self):
+        """Test that a batch size of one still analyzes every sampled frame."""
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager()
+        )
+        processor = VideoProcessor(
+            orchestrator=orchestrator, output_dir=self.test_dir, batch_size=1
+        )
+        
+        processor.process(self.video_path)
+        
+        self.assertEqual(analyzer.calls, 3)
+        with self.assertRaises(ValidationError):
+            VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir, batch_size=0)
+    
+    def test_pipeline_shuts_down_on_error(self):
+        """Test that an error in the main loop still stops the worker threads."""
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=StubVisionAnalyzer(),
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        threads_before = threading.active_count()
+        
+        with patch.object(processor, '_complete_frame', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                processor.process(self.video_path)
+        
+        self.assertEqual(threading.active_count(), threads_before)
+    
+    def test_alert_image_errors_do_not_stop_writer(self):
+        """Test that a failing image save is skipped and the pipeline finishes."""
+        alert_manager = AlertManager(quiet=True)
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=StubVisionAnalyzer(),
+            zone_monitor=ZoneMonitor(),
+            alert_manager=alert_manager,
+            quiet=True
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        threads_before = threading.active_count()
+        
+        with patch.object(processor, '_save_alert_image', side_effect=cv2.error("bad")) as save, \
+                patch('retail_theft_detection.PipelineConfig.ALERT_QUEUE_SIZE', 1):
+            processor.process(self.video_path)
+        
+        self.assertEqual(save.call_count, alert_manager.get_alert_count())
+        self.assertGreater(save.call_count, 1)
+        self.assertEqual(threading.active_count(), threads_before)
+    
+    def test_unchanged_frames_skip_analysis(self):
+        """Test that a static scene is sent to the API only once."""
+        static_path = os.path.join(self.test_dir, "static.avi")
+        writer = cv2.VideoWriter(
+            static_path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (64, 48)
+        )
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        frame[:, 20:28] = 255
+        for _ in range(61):
+            writer.write(frame)
+        writer.release()
+        
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager()
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        
+        processor.process(static_path)
+        
+        self.assertEqual(analyzer.calls, 1)
+        
+        # Reused analyses keep the track live without repeating its alerts
+        tracks = orchestrator.person_tracker.get_all_tracked_people()
+        self.assertEqual([data.last_frame for data in tracks.values()], [60])
+        self.assertEqual(orchestrator.alert_manager.get_alert_count(), 1)
+    
+    def test_unchanged_check_uses_last_analyzed_frame(self):
+        """Test that frames are compared with the frame actually analyzed."""
+        analyzer = StubVisionAnalyzer()
+        orchestrator = DetectionOrchestrator(
+            vision_analyzer=analyzer,
+            zone_monitor=ZoneMonitor(),
+            alert_manager=AlertManager(quiet=True),
+            quiet=True
+        )
+        processor = VideoProcessor(orchestrator=orchestrator, output_dir=self.test_dir)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        
+        def read_frames(cap, total_frames, frame_queue, stop, reader_stats):
+            # Frame 30 matches a frame the live slot dropped, not frame 0
+            frame_queue.put((frame, 0, 0))
+            frame_queue.put((frame, 30, (1 << 64) - 1))
+            frame_queue.put((frame, 60, (1 << 64) - 1))
+            frame_queue.put(None)
+        
+        with patch.object(processor, '_read_frames', side_effect=read_frames):
+            stats = processor._process_frames(None, 0)
+        
+        self.assertEqual(analyzer.calls, 2)
+        self.assertEqual(stats['unchanged'], 1)
+    
+    def test_latest_frame_slot_drops_stale_frames(self):
+        """Test that the live-feed slot keeps only the newest frame."""
+        slot = LatestFrameSlot()
+        
+        slot.put(("frame_a", 0))
+        slot.put(("frame_b", 30))
+        slot.put(None)
+        
+        self.assertEqual(slot.get(), ("frame_b", 30))
+        self.assertIsNone(slot.get())
+        self.assertEqual(slot.dropped, 1)
+
+
+class TestDemoMode(unittest.TestCase):
+    """Test cases for demo mode functionality."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
     
     def test_create_demo_image(self):
         """Test demo image creation."""
@@ -598,6 +1503,12 @@ class TestDemoMode(unittest.TestCase):
         img = cv2.imread(result_path)
         self.assertIsNotNone(img)
         self.assertEqual(img.shape, (480, 640, 3))
+        
+        # PNG output uses the RLE strategy and is still lossless
+        png = cv2.imread(create_demo_image(os.path.join(self.test_dir, "test_demo.png")))
+        self.assertEqual(png.shape, (480, 640, 3))
+        self.assertEqual(png[0, 0].tolist(), [200, 200, 200])
+        self.assertEqual(png[200, 60].tolist(), [150, 150, 150])
     
     def test_mock_vision_client(self):
         """Test mock Azure Vision client."""
@@ -664,26 +1575,19 @@ class TestDemoMode(unittest.TestCase):
 class TestErrorHandling(unittest.TestCase):
     """Test cases for error handling and edge cases."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Patch the Azure client once for the whole class."""
+        patcher = patch('vision_analyzer.ImageAnalysisClient')
+        cls.mock_client_class = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+    
     def setUp(self):
         """Set up test fixtures."""
         self.test_dir = tempfile.mkdtemp()
-        self.patcher = patch('retail_theft_detection.ImageAnalysisClient')
-        self.mock_client_class = self.patcher.start()
-        self.mock_vision_client = MagicMock()
-        self.mock_client_class.return_value = self.mock_vision_client
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.patcher.stop()
-        logging.shutdown()
-        time.sleep(0.1)
-        
-        if os.path.exists(self.test_dir):
-            try:
-                shutil.rmtree(self.test_dir)
-            except PermissionError:
-                time.sleep(0.5)
-                shutil.rmtree(self.test_dir)
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        self.mock_client_class.reset_mock()
+        self.mock_vision_client = self.mock_client_class.return_value
     
     def test_missing_image_file(self):
         """Test handling of missing image file."""
@@ -745,11 +1649,12 @@ class TestErrorHandling(unittest.TestCase):
         cv2.imwrite(test_image, img)
         
         # Mock empty results
-        mock_result = MagicMock()
-        mock_result.people = None
-        mock_result.objects = None
-        mock_result.tags = None
-        mock_result.caption = None
+        mock_result = SimpleNamespace(
+            people=None,
+            objects=None,
+            tags=None,
+            caption=None
+        )
         
         self.mock_vision_client.analyze.return_value = mock_result
         
@@ -764,22 +1669,12 @@ class TestInstrumentation(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.test_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        logging.shutdown()
-        time.sleep(0.1)
-        
-        if os.path.exists(self.test_dir):
-            try:
-                shutil.rmtree(self.test_dir)
-            except PermissionError:
-                time.sleep(0.5)
-                shutil.rmtree(self.test_dir)
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
     
     def test_logging_disabled(self):
         """Test running with logging disabled."""
-        logger = TheftDetectionLogger(
+        logger = _closing_logger(
+            self,
             name="TestLogger",
             log_dir=self.test_dir,
             enable_console=False,
@@ -795,7 +1690,8 @@ class TestInstrumentation(unittest.TestCase):
     
     def test_monitoring_configuration(self):
         """Test performance monitoring can be configured."""
-        logger = TheftDetectionLogger(
+        logger = _closing_logger(
+            self,
             name="TestLogger",
             log_dir=self.test_dir
         )
@@ -811,7 +1707,8 @@ class TestInstrumentation(unittest.TestCase):
     def test_log_level_configuration(self):
         """Test that log levels can be configured."""
         # Test DEBUG level
-        logger = TheftDetectionLogger(
+        logger = _closing_logger(
+            self,
             name="TestLogger",
             log_dir=self.test_dir,
             log_level=logging.DEBUG,
@@ -821,7 +1718,8 @@ class TestInstrumentation(unittest.TestCase):
         self.assertEqual(logger.logger.level, logging.DEBUG)
         
         # Test WARNING level
-        logger2 = TheftDetectionLogger(
+        logger2 = _closing_logger(
+            self,
             name="TestLogger2",
             log_dir=self.test_dir,
             log_level=logging.WARNING,
@@ -15,29 +15,247 @@ Features:
 Author: AI-102 Study Implementation
 """
 
+import atexit
+import io
 import logging
 import logging.handlers
+import math
+import queue
 import time
 import json
 import sys
-import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, TextIO, Tuple, Union
+from collections import deque
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
 
-# For Azure Application Insights (optional)
+import numpy as np
+
+# For Azure Application Insights (optional, imported on first use because
+# opencensus pulls in a sizeable dependency tree)
+AZURE_INSIGHTS_AVAILABLE = None
+AzureLogHandler = None
+
+
+def _load_azure() -> bool:
+    """
+    Import the Application Insights log exporter on demand.
+    
+    Returns:
+        True if opencensus-ext-azure is installed
+    """
+    global AZURE_INSIGHTS_AVAILABLE, AzureLogHandler
+    if AZURE_INSIGHTS_AVAILABLE is None:
+        try:
+            from opencensus.ext.azure.log_exporter import AzureLogHandler
+            AZURE_INSIGHTS_AVAILABLE = True
+        except ImportError:
+            AZURE_INSIGHTS_AVAILABLE = False
+    return AZURE_INSIGHTS_AVAILABLE
+
+
+# Application Insights upload batching (records per request, seconds between uploads)
+AZURE_MAX_BATCH_SIZE = 50
+AZURE_EXPORT_INTERVAL_S = 10.0
+
+# Native JSON encoder for structured logs (optional)
 try:
-    from opencensus.ext.azure import metrics_exporter
-    from opencensus.ext.azure.log_exporter import AzureLogHandler
-    from opencensus.stats import aggregation as aggregation_module
-    from opencensus.stats import measure as measure_module
-    from opencensus.stats import stats as stats_module
-    from opencensus.stats import view as view_module
-    from opencensus.tags import tag_map as tag_map_module
-    AZURE_INSIGHTS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 except ImportError:
-    AZURE_INSIGHTS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Any) -> str:
+    """
+    Serialize data to a JSON string, using orjson when it is installed.
+    
+    Non-string dict keys (e.g. int ids) are accepted as with json.dumps.
+    
+    Args:
+        data: Object to serialize (non-JSON types are converted with str)
+        
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(data, default=str)
+
+
+def _context_json(record: logging.LogRecord) -> str:
+    """
+    Get the record's context as JSON, serializing it at most once.
+    
+    Several sinks format the same record, so the encoded context is
+    cached on the record itself.
+    
+    Args:
+        record: Log record carrying a 'context' attribute
+        
+    Returns:
+        JSON string of the context
+    """
+    encoded = getattr(record, 'context_json', None)
+    if encoded is None:
+        encoded = _json_dumps(record.context)
+        record.context_json = encoded
+    return encoded
+
+
+class ContextFormatter(logging.Formatter):
+    """
+    Text formatter that appends a record's context to its message.
+    
+    Context is passed as LogRecord data (extra={'context': ...}) and only
+    serialized here, on the listener thread, instead of by the caller.
+    """
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Render the format string with the context after the message."""
+        if getattr(record, 'context', None):
+            record.message = f"{record.message} | Context: {_context_json(record)}"
+        return super().formatMessage(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Structured formatter producing one JSON object per record.
+    
+    Builds a dict from the record and encodes it in a single call, so
+    quotes or newlines in messages cannot corrupt the output. Timestamps
+    keep the "YYYY-MM-DD HH:MM:SS,mmm" string format; the date and time
+    part is formatted once per second and reused.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_second = (None, '')
+    
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """
+        Format a record's creation time, reusing the per-second prefix.
+        
+        Args:
+            record: Log record to timestamp
+            
+        Returns:
+            Timestamp string with milliseconds
+        """
+        second = int(record.created)
+        cached = self._cached_second
+        if cached[0] != second:
+            cached = (second, time.strftime('%Y-%m-%d %H:%M:%S', self.converter(second)))
+            self._cached_second = cached
+        return f"{cached[1]},{int(record.msecs):03d}"
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as a JSON line.
+        
+        Args:
+            record: Log record to format
+            
+        Returns:
+            JSON string
+        """
+        entry = {
+            'timestamp': self._format_timestamp(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'function': record.funcName,
+            'line': record.lineno,
+            'message': record.getMessage()
+        }
+        
+        context = getattr(record, 'context', None)
+        if context:
+            entry['context'] = context
+        
+        return _json_dumps(entry)
+
+
+class BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    Daily-rotating file handler that batches writes through a large buffer.
+    
+    The stock handler flushes after every record, costing one write(2)
+    syscall per log line. Here records accumulate in the file buffer and
+    are written out in buffer-sized chunks. The buffer is flushed for
+    ERROR and above (so failures are on disk immediately) and when the
+    file rolls over or is closed; logging.shutdown flushes it at exit.
+    """
+    
+    def __init__(self, *args, buffer_size: int = 65536, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            *args: Positional arguments for TimedRotatingFileHandler
+            buffer_size: Size of the file write buffer in bytes (default: 64 KiB)
+            **kwargs: Keyword arguments for TimedRotatingFileHandler
+        """
+        # Must be set before the base class opens the stream
+        self.buffer_size = buffer_size
+        super().__init__(*args, **kwargs)
+    
+    
+    def _open(self):
+        """Open the log file with an enlarged write buffer."""
+        return self._builtin_open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+    
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Determine if the log file should roll over.
+        
+        Compares the record's own creation time against the precomputed
+        rollover deadline, so the common case costs no clock read or
+        file stat. The base class check only runs once the deadline
+        has passed (about once per day).
+        
+        Args:
+            record: Log record about to be written
+            
+        Returns:
+            True if rollover should occur
+        """
+        if record.created < self.rolloverAt:
+            return False
+        return super().shouldRollover(record)
+    
+    
+    def emit(self, record: logging.LogRecord):
+        """
+        Write a record, flushing only for ERROR and above.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(self.format(record) + self.terminator)
+            
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class TheftDetectionLogger:
@@ -50,6 +268,9 @@ class TheftDetectionLogger:
     - Console output for development
     - Structured JSON logging for production
     - Azure Application Insights integration
+    
+    Records are handed to a background QueueListener thread, so callers
+    on the frame-processing path never block on file or network I/O.
     """
     
     def __init__(self, 
@@ -84,29 +305,28 @@ class TheftDetectionLogger:
         
         # Define log format
         # Format: [timestamp] [level] [module] - message
-        self.log_format = logging.Formatter(
+        self.log_format = ContextFormatter(
             fmt='[%(asctime)s] [%(levelname)8s] [%(name)s.%(funcName)s:%(lineno)d] - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
         # JSON format for structured logging
-        self.json_format = logging.Formatter(
-            fmt='{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-                '"logger": "%(name)s", "function": "%(funcName)s", '
-                '"line": %(lineno)d, "message": "%(message)s"}'
-        )
+        self.json_format = JsonFormatter()
+        
+        # Sinks are driven by the queue listener, not attached to the logger
+        handlers = []
         
         # Add console handler if enabled
         if enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(log_level)
             console_handler.setFormatter(self.log_format)
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # Add file handler if enabled
         if enable_file:
             # Main log file (all levels)
-            file_handler = logging.handlers.TimedRotatingFileHandler(
+            file_handler = BufferedTimedRotatingFileHandler(
                 filename=self.log_dir / 'theft_detection.log',
                 when='midnight',  # Rotate at midnight
                 interval=1,       # Every 1 day
@@ -115,10 +335,10 @@ class TheftDetectionLogger:
             )
             file_handler.setLevel(log_level)
             file_handler.setFormatter(self.log_format)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Error log file (ERROR and CRITICAL only)
-            error_handler = logging.handlers.TimedRotatingFileHandler(
+            error_handler = BufferedTimedRotatingFileHandler(
                 filename=self.log_dir / 'theft_detection_errors.log',
                 when='midnight',
                 interval=1,
@@ -127,10 +347,10 @@ class TheftDetectionLogger:
             )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(self.log_format)
-            self.logger.addHandler(error_handler)
+            handlers.append(error_handler)
             
             # JSON structured log file
-            json_handler = logging.handlers.TimedRotatingFileHandler(
+            json_handler = BufferedTimedRotatingFileHandler(
                 filename=self.log_dir / 'theft_detection_json.log',
                 when='midnight',
                 interval=1,
@@ -139,48 +359,97 @@ class TheftDetectionLogger:
             )
             json_handler.setLevel(log_level)
             json_handler.setFormatter(self.json_format)
-            self.logger.addHandler(json_handler)
+            handlers.append(json_handler)
         
         # Add Azure Application Insights handler if enabled
-        if enable_azure and AZURE_INSIGHTS_AVAILABLE and azure_connection_string:
+        azure_enabled = False
+        azure_error = None
+        if enable_azure and azure_connection_string and _load_azure():
             try:
+                # The exporter's worker coalesces records into batched uploads
                 azure_handler = AzureLogHandler(
-                    connection_string=azure_connection_string
+                    connection_string=azure_connection_string,
+                    max_batch_size=AZURE_MAX_BATCH_SIZE,
+                    export_interval=AZURE_EXPORT_INTERVAL_S
                 )
                 azure_handler.setLevel(log_level)
-                self.logger.addHandler(azure_handler)
-                self.logger.info("Azure Application Insights logging enabled")
+                azure_handler.setFormatter(ContextFormatter())
+                handlers.append(azure_handler)
+                azure_enabled = True
             except Exception as e:
-                self.logger.warning(f"Failed to initialize Azure logging: {e}")
+                azure_error = e
+        
+        # Hot path only enqueues; formatting and I/O happen on the listener thread
+        self._handlers = handlers
+        self._log_queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        self._closed = False
+        atexit.register(self.close)
+        
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        
+        # debug()..critical() are per-level emitters, skipping the level dispatch
+        self.debug = self._make_emitter(logging.DEBUG)
+        self.info = self._make_emitter(logging.INFO)
+        self.warning = self._make_emitter(logging.WARNING)
+        self.error = self._make_emitter(logging.ERROR)
+        self.critical = self._make_emitter(logging.CRITICAL)
+        
+        if azure_error is not None:
+            self.logger.warning(f"Failed to initialize Azure logging: {azure_error}")
+        elif azure_enabled:
+            self.logger.info("Azure Application Insights logging enabled")
         
         self.logger.info(f"Logger initialized: {name}")
         self.logger.info(f"Log directory: {log_dir}")
         self.logger.info(f"Log level: {logging.getLevelName(log_level)}")
     
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message with optional context."""
-        self._log_with_context(logging.DEBUG, message, kwargs)
-    
-    
-    def info(self, message: str, **kwargs):
-        """Log info message with optional context."""
-        self._log_with_context(logging.INFO, message, kwargs)
-    
-    
-    def warning(self, message: str, **kwargs):
-        """Log warning message with optional context."""
-        self._log_with_context(logging.WARNING, message, kwargs)
-    
-    
-    def error(self, message: str, **kwargs):
-        """Log error message with optional context."""
-        self._log_with_context(logging.ERROR, message, kwargs)
+    def close(self):
+        """
+        Stop the background listener and close all log sinks.
+        
+        Pending records are drained before the handlers are closed.
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        
+        # Release the exit hook so a closed logger can be garbage collected
+        atexit.unregister(self.close)
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
     
     
-    def critical(self, message: str, **kwargs):
-        """Log critical message with optional context."""
-        self._log_with_context(logging.CRITICAL, message, kwargs)
+    def _make_emitter(self, level: int):
+        """
+        Build a logging function specialized for one level.
+        
+        Args:
+            level: Log level the function emits at
+            
+        Returns:
+            Function taking (message, **context)
+        """
+        log = self.logger.log
+        is_enabled = self.logger.isEnabledFor
+        
+        def emit(message: str, **context):
+            if not is_enabled(level):
+                return
+            # stacklevel=2 attributes the record to the caller, not this closure
+            if context:
+                log(level, message, extra={'context': context}, stacklevel=2)
+            else:
+                log(level, message, stacklevel=2)
+        
+        emit.__name__ = logging.getLevelName(level).lower()
+        return emit
     
     
     def exception(self, message: str, exc_info=True, **kwargs):
@@ -192,27 +461,12 @@ class TheftDetectionLogger:
             exc_info: Include exception info (default: True)
             **kwargs: Additional context
         """
+        # Rare path: keep the context ahead of the traceback in the message
         if kwargs:
-            message = f"{message} | Context: {json.dumps(kwargs)}"
+            message = f"{message} | Context: {_json_dumps(kwargs)}"
         self.logger.exception(message, exc_info=exc_info)
     
     
-    def _log_with_context(self, level: int, message: str, context: Dict[str, Any]):
-        """
-        Internal method to log with additional context.
-        
-        Args:
-            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-            message: Log message
-            context: Dictionary of additional context data
-        """
-        if context:
-            # Add context as JSON string to message
-            message = f"{message} | Context: {json.dumps(context, default=str)}"
-        
-        self.logger.log(level, message)
-    
-    
     def log_api_call(self, 
                      endpoint: str, 
                      duration_ms: float, 
@@ -282,6 +536,140 @@ class TheftDetectionLogger:
         )
 
 
+# Maximum number of samples kept in memory per metric series
+MAX_METRICS_IN_MEMORY = 1000
+
+
+class MetricRingBuffer:
+    """
+    Fixed-capacity ring buffer of metric samples stored column-wise.
+    
+    Each field lives in its own preallocated NumPy array, so recording a
+    sample is a handful of scalar stores (no per-sample dict) and
+    statistics reduce over contiguous arrays. Once full, the oldest
+    sample is overwritten.
+    
+    Fields listed in ``tracked`` also keep a running sum, minimum and
+    maximum over the window, updated as samples are added and evicted.
+    """
+    
+    def __init__(self, fields: List[Tuple[str, Any]], capacity: int = MAX_METRICS_IN_MEMORY,
+                 tracked: Tuple[str, ...] = ()):
+        """
+        Initialize the buffer.
+        
+        Args:
+            fields: List of (field_name, numpy dtype) pairs, in append order
+            capacity: Maximum number of samples retained
+            tracked: Numeric field names whose window summary is maintained
+        """
+        self.capacity = capacity
+        self._names = [name for name, _ in fields]
+        self._columns = [np.empty(capacity, dtype=dtype) for _, dtype in fields]
+        self._index = dict(zip(self._names, self._columns))
+        self._head = 0
+        self._count = 0
+        
+        # Running window aggregates: name -> [sum, min, max]
+        self._tracked = [(name, self._names.index(name)) for name in tracked]
+        self._aggregates = {name: [0.0, math.inf, -math.inf] for name in tracked}
+        self._stale = set()
+    
+    
+    def __len__(self) -> int:
+        """Number of samples currently stored."""
+        return self._count
+    
+    
+    def append(self, *values):
+        """
+        Record one sample.
+        
+        Args:
+            *values: One value per field, in the order given at construction
+        """
+        i = self._head
+        full = self._count == self.capacity
+        
+        for name, pos in self._tracked:
+            value = float(values[pos])
+            agg = self._aggregates[name]
+            if full:
+                evicted = float(self._columns[pos][i])
+                agg[0] -= evicted
+                # Evicting the current extreme forces a rescan on next read
+                if evicted <= agg[1] or evicted >= agg[2]:
+                    self._stale.add(name)
+            agg[0] += value
+            if value < agg[1]:
+                agg[1] = value
+            if value > agg[2]:
+                agg[2] = value
+        
+        for column, value in zip(self._columns, values):
+            column[i] = value
+        
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        
+        # Re-sum once per lap so add/subtract rounding cannot accumulate
+        if self._head == 0:
+            for name, pos in self._tracked:
+                self._aggregates[name][0] = float(self._columns[pos].sum())
+    
+    
+    def values(self, name: str) -> np.ndarray:
+        """
+        Get the stored samples of one field, in storage order.
+        
+        Suitable for order-independent reductions (mean, min, max).
+        
+        Args:
+            name: Field name
+            
+        Returns:
+            Array view of the valid samples
+        """
+        return self._index[name][:self._count]
+    
+    
+    def summary(self, name: str) -> Tuple[float, float, float]:
+        """
+        Get the mean, minimum and maximum of a tracked field.
+        
+        Args:
+            name: Tracked field name (buffer must not be empty)
+            
+        Returns:
+            Tuple of (mean, min, max) over the stored samples
+        """
+        agg = self._aggregates[name]
+        if name in self._stale:
+            window = self.values(name)
+            agg[1] = float(window.min())
+            agg[2] = float(window.max())
+            self._stale.discard(name)
+        
+        return agg[0] / self._count, agg[1], agg[2]
+    
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convert the samples to a list of dicts, oldest first.
+        
+        Returns:
+            List of {field_name: value} dictionaries with Python scalars
+        """
+        if self._count < self.capacity:
+            order = np.arange(self._count)
+        else:
+            order = (np.arange(self.capacity) + self._head) % self.capacity
+        
+        columns = [column[order].tolist() for column in self._columns]
+        return [dict(zip(self._names, row)) for row in zip(*columns)]
+
+
 class PerformanceMonitor:
     """
     Performance monitoring and metrics collection.
@@ -303,13 +691,22 @@ class PerformanceMonitor:
         """
         self.logger = logger
         
-        # Metrics storage
+        # Metrics storage (numeric series are column-wise ring buffers)
         self.metrics = {
-            'api_calls': [],           # API call durations
-            'frame_processing': [],    # Frame processing times
-            'detections': [],          # Detection events
-            'alerts': [],              # Alert events
-            'errors': []               # Error events
+            'api_calls': MetricRingBuffer([        # API call durations
+                ('timestamp', np.float64),
+                ('endpoint', object),
+                ('duration_ms', np.float64),
+                ('success', np.bool_)
+            ], tracked=('duration_ms',)),
+            'frame_processing': MetricRingBuffer([ # Frame processing times
+                ('timestamp', np.float64),
+                ('frame_number', np.int64),
+                ('duration_ms', np.float64)
+            ], tracked=('duration_ms',)),
+            'detections': deque(maxlen=MAX_METRICS_IN_MEMORY),  # Detection events
+            'alerts': deque(maxlen=MAX_METRICS_IN_MEMORY),      # Alert events
+            'errors': deque(maxlen=MAX_METRICS_IN_MEMORY)       # Error events
         }
         
         # Counters
@@ -320,6 +717,25 @@ class PerformanceMonitor:
             'total_alerts': 0,
             'total_errors': 0
         }
+        
+        # Last (epoch, ISO string) pair, reused for records within the same millisecond
+        self._ts_cache = (0.0, "")
+    
+    
+    def _now_iso(self) -> str:
+        """
+        Get the current time as an ISO string, cached to millisecond resolution.
+        
+        Returns:
+            ISO-formatted timestamp
+        """
+        now = time.time()
+        if 0.0 <= now - self._ts_cache[0] < 0.001:
+            return self._ts_cache[1]
+        
+        iso = datetime.fromtimestamp(now).isoformat()
+        self._ts_cache = (now, iso)
+        return iso
     
     
     def record_api_call(self, endpoint: str, duration_ms: float, success: bool = True):
@@ -331,19 +747,10 @@ class PerformanceMonitor:
             duration_ms: Call duration in milliseconds
             success: Whether call succeeded
         """
-        self.metrics['api_calls'].append({
-            'timestamp': datetime.now().isoformat(),
-            'endpoint': endpoint,
-            'duration_ms': duration_ms,
-            'success': success
-        })
+        self.metrics['api_calls'].append(time.time(), endpoint, duration_ms, success)
         
         self.counters['total_api_calls'] += 1
         
-        # Keep only last 1000 metrics to prevent memory issues
-        if len(self.metrics['api_calls']) > 1000:
-            self.metrics['api_calls'] = self.metrics['api_calls'][-1000:]
-        
         self.logger.log_performance_metric('api_call_duration', duration_ms, 'ms')
     
     
@@ -355,17 +762,10 @@ class PerformanceMonitor:
             frame_number: Frame number
             duration_ms: Processing duration in milliseconds
         """
-        self.metrics['frame_processing'].append({
-            'timestamp': datetime.now().isoformat(),
-            'frame_number': frame_number,
-            'duration_ms': duration_ms
-        })
+        self.metrics['frame_processing'].append(time.time(), frame_number, duration_ms)
         
         self.counters['total_frames'] += 1
         
-        if len(self.metrics['frame_processing']) > 1000:
-            self.metrics['frame_processing'] = self.metrics['frame_processing'][-1000:]
-        
         self.logger.log_performance_metric('frame_processing_duration', duration_ms, 'ms')
     
     
@@ -379,16 +779,13 @@ class PerformanceMonitor:
             severity: Alert severity
         """
         self.metrics['detections'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
             'event_type': event_type,
             'confidence': confidence,
             'severity': severity
         })
         
         self.counters['total_detections'] += 1
-        
-        if len(self.metrics['detections']) > 1000:
-            self.metrics['detections'] = self.metrics['detections'][-1000:]
     
     
     def record_alert(self, alert_type: str, severity: str):
@@ -400,15 +797,12 @@ class PerformanceMonitor:
             severity: Alert severity
         """
         self.metrics['alerts'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
             'alert_type': alert_type,
             'severity': severity
         })
         
         self.counters['total_alerts'] += 1
-        
-        if len(self.metrics['alerts']) > 1000:
-            self.metrics['alerts'] = self.metrics['alerts'][-1000:]
     
     
     def record_error(self, error_type: str, message: str):
@@ -420,15 +814,12 @@ class PerformanceMonitor:
             message: Error message
         """
         self.metrics['errors'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
             'error_type': error_type,
             'message': message
         })
         
         self.counters['total_errors'] += 1
-        
-        if len(self.metrics['errors']) > 1000:
-            self.metrics['errors'] = self.metrics['errors'][-1000:]
     
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -444,18 +835,18 @@ class PerformanceMonitor:
         }
         
         # Calculate average API call duration
-        if self.metrics['api_calls']:
-            api_durations = [m['duration_ms'] for m in self.metrics['api_calls']]
-            stats['averages']['api_call_ms'] = sum(api_durations) / len(api_durations)
-            stats['averages']['api_call_min_ms'] = min(api_durations)
-            stats['averages']['api_call_max_ms'] = max(api_durations)
+        if len(self.metrics['api_calls']):
+            mean_ms, min_ms, max_ms = self.metrics['api_calls'].summary('duration_ms')
+            stats['averages']['api_call_ms'] = mean_ms
+            stats['averages']['api_call_min_ms'] = min_ms
+            stats['averages']['api_call_max_ms'] = max_ms
         
         # Calculate average frame processing duration
-        if self.metrics['frame_processing']:
-            frame_durations = [m['duration_ms'] for m in self.metrics['frame_processing']]
-            stats['averages']['frame_processing_ms'] = sum(frame_durations) / len(frame_durations)
-            stats['averages']['frame_processing_min_ms'] = min(frame_durations)
-            stats['averages']['frame_processing_max_ms'] = max(frame_durations)
+        if len(self.metrics['frame_processing']):
+            mean_ms, min_ms, max_ms = self.metrics['frame_processing'].summary('duration_ms')
+            stats['averages']['frame_processing_ms'] = mean_ms
+            stats['averages']['frame_processing_min_ms'] = min_ms
+            stats['averages']['frame_processing_max_ms'] = max_ms
         
         # Calculate alert rate (alerts per frame)
         if self.counters['total_frames'] > 0:
@@ -472,44 +863,76 @@ class PerformanceMonitor:
         """Print performance statistics to console."""
         stats = self.get_statistics()
         
-        print("\n" + "="*70)
-        print("PERFORMANCE STATISTICS")
-        print("="*70)
+        # Assemble the report in memory and hand it to stdout in one write
+        buf = io.StringIO()
+        buf.write("\n" + "="*70 + "\n")
+        buf.write("PERFORMANCE STATISTICS\n")
+        buf.write("="*70 + "\n")
         
-        print("\nCounters:")
+        buf.write("\nCounters:\n")
         for key, value in stats['counters'].items():
-            print(f"  {key}: {value}")
+            buf.write(f"  {key}: {value}\n")
         
         if 'averages' in stats and stats['averages']:
-            print("\nAverages:")
+            buf.write("\nAverages:\n")
             for key, value in stats['averages'].items():
-                print(f"  {key}: {value:.2f}")
+                buf.write(f"  {key}: {value:.2f}\n")
         
         if 'rates' in stats:
-            print("\nRates:")
+            buf.write("\nRates:\n")
             for key, value in stats['rates'].items():
-                print(f"  {key}: {value:.4f}")
+                buf.write(f"  {key}: {value:.4f}\n")
         
-        print("="*70 + "\n")
+        buf.write("="*70 + "\n\n")
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     
-    def export_metrics(self, output_file: str):
+    def export_metrics(self, output_file: Union[str, TextIO]):
         """
         Export metrics to JSON file.
         
         Args:
-            output_file: Path to output file
+            output_file: Path to output file, or an open text stream to write to
         """
         data = {
             'timestamp': datetime.now().isoformat(),
             'statistics': self.get_statistics(),
-            'metrics': self.metrics
+            'metrics': {
+                name: self._series_to_records(series)
+                if isinstance(series, MetricRingBuffer) else list(series)
+                for name, series in self.metrics.items()
+            }
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Compact encoding, handed to the file in a single write
+        payload = _json_dumps(data)
+        if hasattr(output_file, 'write'):
+            output_file.write(payload)
+            target = getattr(output_file, 'name', type(output_file).__name__)
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            target = output_file
+        
+        self.logger.info(f"Metrics exported to {target}")
+    
+    
+    def _series_to_records(self, series: MetricRingBuffer) -> List[Dict[str, Any]]:
+        """
+        Convert a numeric metric series to exportable records.
         
-        self.logger.info(f"Metrics exported to {output_file}")
+        Args:
+            series: MetricRingBuffer with an epoch 'timestamp' field
+            
+        Returns:
+            List of record dictionaries with ISO-formatted timestamps
+        """
+        records = series.to_records()
+        for record in records:
+            record['timestamp'] = datetime.fromtimestamp(record['timestamp']).isoformat()
+        return records
 
 
 # Decorators for automatic instrumentation
@@ -518,6 +941,9 @@ def log_execution_time(logger: TheftDetectionLogger):
     """
     Decorator to log function execution time.
     
+    Durations are measured on the monotonic performance counter and logged
+    as duration_ms (float milliseconds).
+    
     Usage:
         @log_execution_time(logger)
         def my_function():
@@ -526,27 +952,37 @@ def log_execution_time(logger: TheftDetectionLogger):
     Args:
         logger: TheftDetectionLogger instance
     """
+    # Resolved once here rather than on every wrapped call
+    _lg = logger.logger
+    _debug = logger.debug
+    _error = logger.error
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Nothing would be logged either way, so skip the timing entirely
+            if not _lg.isEnabledFor(logging.ERROR):
+                return func(*args, **kwargs)
+            
+            start_ns = time.perf_counter_ns()
             
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
                 
-                logger.debug(
-                    f"Function executed: {func.__name__}",
-                    duration_ms=duration_ms,
-                    success=True
-                )
+                if _lg.isEnabledFor(logging.DEBUG):
+                    duration_ms = (time.perf_counter_ns() - start_ns) * 1e-6
+                    _debug(
+                        f"Function executed: {func.__name__}",
+                        duration_ms=duration_ms,
+                        success=True
+                    )
                 
                 return result
             
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) * 1e-6
                 
-                logger.error(
+                _error(
                     f"Function failed: {func.__name__}",
                     duration_ms=duration_ms,
                     error=str(e),
@@ -573,40 +1009,51 @@ def retry_on_error(logger: TheftDetectionLogger, max_retries: int = 3, delay_sec
         max_retries: Maximum number of retry attempts
         delay_seconds: Initial delay between retries (doubles each time)
     """
+    _info = logger.info
+    _warning = logger.warning
+    _error = logger.error
+    _critical = logger.critical
+    
+    # Exponential backoff schedule, computed once per decorator
+    waits = [delay_seconds * (1 << i) for i in range(max_retries)]
+    
     def decorator(func):
+        def log_failure(attempt: int, error: Exception):
+            _error(
+                f"Attempt {attempt + 1} failed for {func.__name__}: {str(error)}",
+                attempt=attempt + 1,
+                max_retries=max_retries + 1,
+                error_type=type(error).__name__
+            )
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
+            # Fast path: the first attempt never touches the retry machinery
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                last_exception = e
+                log_failure(0, e)
             
-            for attempt in range(max_retries + 1):
+            for attempt, wait_time in enumerate(waits, start=1):
+                _warning(
+                    f"Retrying {func.__name__} (attempt {attempt + 1}/{max_retries + 1})",
+                    wait_time=wait_time
+                )
+                time.sleep(wait_time)
+                
                 try:
-                    if attempt > 0:
-                        # Exponential backoff
-                        wait_time = delay_seconds * (2 ** (attempt - 1))
-                        logger.warning(
-                            f"Retrying {func.__name__} (attempt {attempt + 1}/{max_retries + 1})",
-                            wait_time=wait_time
-                        )
-                        time.sleep(wait_time)
-                    
                     result = func(*args, **kwargs)
-                    
-                    if attempt > 0:
-                        logger.info(f"Retry successful for {func.__name__} after {attempt} attempt(s)")
-                    
-                    return result
-                
                 except Exception as e:
                     last_exception = e
-                    logger.error(
-                        f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}",
-                        attempt=attempt + 1,
-                        max_retries=max_retries + 1,
-                        error_type=type(e).__name__
-                    )
+                    log_failure(attempt, e)
+                    continue
+                
+                _info(f"Retry successful for {func.__name__} after {attempt} attempt(s)")
+                return result
             
             # All retries exhausted
-            logger.critical(
+            _critical(
                 f"All retries exhausted for {func.__name__}",
                 max_retries=max_retries,
                 error=str(last_exception)
@@ -630,17 +1077,18 @@ def log_errors(logger: TheftDetectionLogger):
     Args:
         logger: TheftDetectionLogger instance
     """
+    _exception = logger.exception
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.exception(
+                _exception(
                     f"Error in {func.__name__}: {str(e)}",
                     function=func.__name__,
-                    error_type=type(e).__name__,
-                    traceback=traceback.format_exc()
+                    error_type=type(e).__name__
                 )
                 raise
         